@@ -0,0 +1,44 @@
+"""add search vector to blog
+
+Revision ID: 5d83c2f1a9e4
+Revises: e41f0a8d6b27
+Create Date: 2026-10-18 15:02:44.851362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d83c2f1a9e4'
+down_revision: Union[str, None] = 'e41f0a8d6b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'blogs',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_blogs_search_vector', 'blogs', ['search_vector'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blogs_search_vector', table_name='blogs')
+    op.drop_column('blogs', 'search_vector')
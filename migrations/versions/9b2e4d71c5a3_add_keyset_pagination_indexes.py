@@ -0,0 +1,44 @@
+"""add keyset pagination indexes
+
+Revision ID: 9b2e4d71c5a3
+Revises: 3c01e8959817
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4d71c5a3'
+down_revision: Union[str, None] = '3c01e8959817'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_blogs_datetime_created_uid', 'blogs',
+        ['datetime_created', 'uid'], unique=False
+    )
+    op.create_index(
+        'ix_blogs_author_uid_datetime_created_uid', 'blogs',
+        ['author_uid', 'datetime_created', 'uid'], unique=False
+    )
+    op.create_index(
+        'ix_reviews_datetime_created_uid', 'reviews',
+        ['datetime_created', 'uid'], unique=False
+    )
+    op.create_index(
+        'ix_tags_datetime_created_uid', 'tags',
+        ['datetime_created', 'uid'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tags_datetime_created_uid', table_name='tags')
+    op.drop_index('ix_reviews_datetime_created_uid', table_name='reviews')
+    op.drop_index('ix_blogs_author_uid_datetime_created_uid', table_name='blogs')
+    op.drop_index('ix_blogs_datetime_created_uid', table_name='blogs')
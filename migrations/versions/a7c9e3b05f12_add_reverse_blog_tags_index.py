@@ -0,0 +1,29 @@
+"""add reverse blog_tags index
+
+Revision ID: a7c9e3b05f12
+Revises: 5d83c2f1a9e4
+Create Date: 2026-10-18 15:40:19.603278
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c9e3b05f12'
+down_revision: Union[str, None] = '5d83c2f1a9e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_blog_tags_tag_uid_blog_uid', 'blog_tags',
+        ['tag_uid', 'blog_uid'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blog_tags_tag_uid_blog_uid', table_name='blog_tags')
@@ -0,0 +1,46 @@
+"""add review foreign key indexes
+
+Revision ID: c58d1e7a2b90
+Revises: a7c9e3b05f12
+Create Date: 2026-10-18 16:21:53.118640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58d1e7a2b90'
+down_revision: Union[str, None] = 'a7c9e3b05f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# blogs.author_uid is already the leading column of
+# ix_blogs_author_uid_datetime_created_uid, so it needs no index of its own.
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_reviews_blog_uid'), 'reviews', ['blog_uid'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            op.f('ix_reviews_author_uid'), 'reviews', ['author_uid'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_reviews_author_uid'), table_name='reviews',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            op.f('ix_reviews_blog_uid'), table_name='reviews',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,61 @@
+"""add review aggregates to blog
+
+Revision ID: e41f0a8d6b27
+Revises: 9b2e4d71c5a3
+Create Date: 2026-10-18 13:48:05.217904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41f0a8d6b27'
+down_revision: Union[str, None] = '9b2e4d71c5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'blogs',
+        sa.Column('review_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'blogs',
+        sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.execute(
+        '''
+        UPDATE blogs
+        SET review_count = totals.review_count,
+            rating_sum = totals.rating_sum
+        FROM (
+            SELECT blog_uid,
+                   count(*) AS review_count,
+                   coalesce(sum(rating), 0) AS rating_sum
+            FROM reviews
+            GROUP BY blog_uid
+        ) AS totals
+        WHERE blogs.uid = totals.blog_uid
+        '''
+    )
+    op.create_index(
+        'ix_blogs_average_rating_uid', 'blogs',
+        [
+            sa.text(
+                '(CAST(rating_sum AS NUMERIC) / '
+                'CAST(greatest(review_count, 1) AS NUMERIC)) DESC'
+            ),
+            sa.text('uid DESC'),
+        ],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blogs_average_rating_uid', table_name='blogs')
+    op.drop_column('blogs', 'rating_sum')
+    op.drop_column('blogs', 'review_count')
@@ -0,0 +1,46 @@
+"""add revoked tokens
+
+Revision ID: f3b8d2c61e47
+Revises: c58d1e7a2b90
+Create Date: 2026-10-18 21:04:37.512903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2c61e47'
+down_revision: Union[str, None] = 'c58d1e7a2b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('revoked_tokens',
+    sa.Column('jti', sa.UUID(), nullable=False),
+    sa.Column('expires_at', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('datetime_created', postgresql.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    op.create_index(
+        op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens',
+        ['expires_at'], unique=False
+    )
+    op.create_index(
+        op.f('ix_revoked_tokens_datetime_created'), 'revoked_tokens',
+        ['datetime_created'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_revoked_tokens_datetime_created'), table_name='revoked_tokens'
+    )
+    op.drop_index(
+        op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens'
+    )
+    op.drop_table('revoked_tokens')
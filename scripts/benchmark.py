@@ -0,0 +1,240 @@
+"""In-process load benchmark for every router.
+
+Drives `src.app` through httpx's ASGI transport with concurrent workers,
+so no server or network is involved. For each route it reports latency
+percentiles, throughput and SQL statements per request. Results are
+written as JSON, tagged with the current commit, for comparing runs.
+
+    python -m scripts.benchmark --database-url postgresql+asyncpg://... \\
+        [--seed --scale 100k] [--concurrency 20] [--requests 1000] \\
+        [--routes blog.list,blog.detail] [--compare previous.json]
+
+--seed drops and reseeds the target database first (see scripts.seed).
+"""
+import argparse
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+request_queries = contextvars.ContextVar('request_queries', default=None)
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def build_routes(sizes: dict) -> dict:
+    """Route name -> (method, needs_auth, request builder).
+
+    Each builder takes a per-request counter and returns (path, json body).
+    """
+    from scripts.seed import seed_uid
+
+    def blog_slug(_):
+        return f'blog-{random.randint(1, sizes["blogs"])}'
+
+    return {
+        'blog.list': ('GET', False, lambda n: ('/api/v1/blog/?limit=20', None)),
+        'blog.list_100': ('GET', False, lambda n: ('/api/v1/blog/?limit=100', None)),
+        'blog.list_by_tags': ('GET', False, lambda n: (
+            '/api/v1/blog/?tags=tag1,tag2&match=any', None
+        )),
+        'blog.detail': ('GET', False, lambda n: (f'/api/v1/blog/{blog_slug(n)}', None)),
+        'blog.search': ('GET', False, lambda n: ('/api/v1/blog/search?q=postgres cache', None)),
+        'blog.top_rated': ('GET', False, lambda n: ('/api/v1/blog/top_rated', None)),
+        'blog.user_blogs': ('GET', True, lambda n: ('/api/v1/blog/user_blogs', None)),
+        'blog.create': ('POST', True, lambda n: ('/api/v1/blog/', {
+            'title': f'Benchmark {n}',
+            'description': 'Created by the benchmark',
+            'slug': f'bench-{time.time_ns()}-{n}',
+            'publish_date': '2024-01-01',
+        })),
+        'blog.bulk_create': ('POST', True, lambda n: ('/api/v1/blog/bulk', {'blogs': [
+            {
+                'title': f'Benchmark {n}.{i}',
+                'description': 'Created by the benchmark',
+                'slug': f'bench-{time.time_ns()}-{n}-{i}',
+                'publish_date': '2024-01-01',
+            }
+            for i in range(100)
+        ]})),
+        'reviews.list': ('GET', False, lambda n: ('/api/v1/reviews/', None)),
+        'reviews.detail': ('GET', False, lambda n: (
+            f'/api/v1/reviews/{seed_uid("review", random.randint(1, sizes["reviews"]))}',
+            None
+        )),
+        'reviews.create': ('POST', True, lambda n: (
+            f'/api/v1/reviews/blogs/{blog_slug(n)}/reviews',
+            {'body': 'Benchmark review', 'rating': 1 + n % 5}
+        )),
+        'tags.list': ('GET', False, lambda n: ('/api/v1/tags/', None)),
+        'tags.detail': ('GET', False, lambda n: (
+            f'/api/v1/tags/{seed_uid("tag", random.randint(1, sizes["tags"]))}', None
+        )),
+        'tags.add_to_blog': ('POST', False, lambda n: (
+            f'/api/v1/tags/blogs/{blog_slug(n)}/tags',
+            {'tags': [{'title': f'tag{random.randint(1, sizes["tags"])}'} for _ in range(5)]}
+        )),
+        'auth.me': ('GET', True, lambda n: ('/api/v1/auth/me', None)),
+    }
+
+
+async def run_route(client, method, build, headers, requests, concurrency) -> dict:
+    counter = itertools.count()
+    latencies = []
+    queries = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while (n := next(counter)) < requests:
+            path, body = build(n)
+            statements = [0]
+            token = request_queries.set(statements)
+            started_at = time.perf_counter()
+
+            try:
+                response = await client.request(method, path, json=body, headers=headers)
+                await response.aread()
+            finally:
+                request_queries.reset(token)
+
+            latencies.append(time.perf_counter() - started_at)
+            queries.append(statements[0])
+            if response.status_code >= 400:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': len(latencies) / elapsed if elapsed else 0.0,
+        'mean_ms': sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'queries_per_request': sum(queries) / len(queries) if queries else 0.0,
+    }
+
+
+def print_comparison(results: dict, previous: dict) -> None:
+    print(f'\nCompared with {previous.get("commit", "?")}:')
+    for name, stats in results['routes'].items():
+        before = previous.get('routes', {}).get(name)
+        if not before:
+            continue
+        for metric in ('p50_ms', 'p99_ms', 'throughput_rps', 'queries_per_request'):
+            if before[metric]:
+                change = (stats[metric] - before[metric]) / before[metric] * 100
+                print(f'  {name:20} {metric:20} {before[metric]:10.2f} -> '
+                      f'{stats[metric]:10.2f} ({change:+.1f}%)')
+
+
+async def main(args: argparse.Namespace) -> None:
+    # The app reads DATABASE_URL at import time, so point it at the
+    # benchmark database before anything under src is imported.
+    os.environ['DATABASE_URL'] = args.database_url
+
+    import httpx
+    from sqlalchemy import event
+    from scripts.seed import SCALES, analyze, reset_schema, seed_database
+    from src import app
+    from src.db.main import sessionmanager
+
+    sizes = SCALES[args.scale]
+
+    if args.seed:
+        sessionmanager.init()
+        async with sessionmanager.connect() as conn:
+            await reset_schema(conn)
+            await seed_database(conn, **sizes)
+            await analyze(conn)
+        await sessionmanager.close()
+
+    def count_statement(*_):
+        statements = request_queries.get()
+        if statements is not None:
+            statements[0] += 1
+
+    routes = build_routes(sizes)
+    if args.routes:
+        routes = {name: routes[name] for name in args.routes.split(',')}
+
+    # The ASGI transport does not send lifespan events, so run the app's
+    # startup and shutdown around the client ourselves.
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url='http://bench') as client
+    ):
+        for engine in sessionmanager.engines:
+            event.listen(engine.sync_engine, 'before_cursor_execute', count_statement)
+
+        login = await client.post(
+            '/api/v1/auth/login', json={'username': 'user1', 'password': 'password'}
+        )
+        login.raise_for_status()
+        auth = {'Authorization': f'Bearer {login.json()["access_token"]}'}
+
+        results = {
+            'commit': current_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'scale': args.scale,
+            'concurrency': args.concurrency,
+            'routes': {},
+        }
+        for name, (method, needs_auth, build) in routes.items():
+            stats = await run_route(
+                client, method, build, auth if needs_auth else None,
+                args.requests, args.concurrency
+            )
+            results['routes'][name] = stats
+            print(
+                f'{name:20} p50={stats["p50_ms"]:8.2f}ms p95={stats["p95_ms"]:8.2f}ms '
+                f'p99={stats["p99_ms"]:8.2f}ms rps={stats["throughput_rps"]:9.1f} '
+                f'queries={stats["queries_per_request"]:5.2f} errors={stats["errors"]}'
+            )
+
+    output = Path(args.output or f'benchmark-{results["commit"]}.json')
+    output.write_text(json.dumps(results, indent=2) + '\n')
+    print(f'Results written to {output}')
+
+    if args.compare:
+        print_comparison(results, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--seed', action='store_true')
+    parser.add_argument('--scale', choices=['10k', '100k', '1m'], default='10k')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--routes')
+    parser.add_argument('--output')
+    parser.add_argument('--compare')
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,93 @@
+"""Compare FastAPI's response serialization with `src.serialization`.
+
+Needs no database: builds ORM-shaped objects in memory and times both
+paths for list responses of several sizes.
+
+    python -m scripts.benchmark_serialization [--sizes 100,1000,10000]
+
+"fastapi" is what FastAPI 0.112 does with a `response_model`: validate,
+dump to Python in json mode, run `jsonable_encoder` and render with
+`json.dumps`. "fast" is `dump_json`, rendered as-is.
+"""
+import argparse
+import time
+import uuid
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.blog.schemas import BlogDetailModel
+from src.pagination import Page
+from src.serialization import dump_json, type_adapter
+
+
+def make_blogs(count: int) -> list:
+    author = SimpleNamespace(
+        first_name='First', last_name='Last',
+        username='user1', email='user1@example.com'
+    )
+    now = datetime.now()
+    return [
+        SimpleNamespace(
+            uid=uuid.uuid4(),
+            title=f'Blog {i}',
+            description='Notes on postgres, cache and latency ' * 5,
+            slug=f'blog-{i}',
+            publish_date=date(2024, 1, 1),
+            datetime_created=now,
+            datetime_updated=now,
+            review_count=i % 40,
+            average_rating=3.5,
+            author=author,
+        )
+        for i in range(count)
+    ]
+
+
+def fastapi_path(response_type, data) -> bytes:
+    adapter = type_adapter(response_type)
+    value = adapter.validate_python(data, from_attributes=True)
+    content = jsonable_encoder(adapter.dump_python(value, mode='json'))
+    return JSONResponse(content).body
+
+
+def fast_path(response_type, data) -> bytes:
+    return dump_json(response_type, data)
+
+
+def best_of(func, response_type, data, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func(response_type, data)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings) * 1000
+
+
+def main(args: argparse.Namespace) -> None:
+    for size in map(int, args.sizes.split(',')):
+        blogs = make_blogs(size)
+        cases = {
+            f'Page[BlogDetailModel] x{size}': (
+                Page[BlogDetailModel], {'items': blogs, 'next_cursor': None}
+            ),
+            f'List[BlogDetailModel] x{size}': (List[BlogDetailModel], blogs),
+        }
+
+        for name, (response_type, data) in cases.items():
+            assert fast_path(response_type, data).count(b'"slug"') == size
+            before = best_of(fastapi_path, response_type, data, args.repeat)
+            after = best_of(fast_path, response_type, data, args.repeat)
+            print(
+                f'{name:32} fastapi={before:9.2f}ms fast={after:9.2f}ms '
+                f'speedup={before / after:5.1f}x'
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='100,1000,10000')
+    parser.add_argument('--repeat', type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,94 @@
+"""Per-call Python overhead of the hot lookup statements.
+
+Needs no database. For each lookup it times what SQLAlchemy does before
+a statement reaches the driver: build the construct (when it is not
+prebuilt), generate its cache key and find the compiled form in a
+compiled cache, as `Connection._execute_clauseelement` does.
+
+    python -m scripts.benchmark_statements [--number 20000]
+
+"inline" builds `select(...).where(column == value)` on every call, as
+the services used to. "prebuilt" calls the cached statement factory and
+binds the value as a parameter.
+"""
+import argparse
+import timeit
+import uuid
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.orm import configure_mappers, joinedload
+
+from src.auth.models import User
+from src.auth.service import user_by_username
+from src.blog.models import Blog
+from src.blog.service import blog_by_slug
+from src.reviews.models import Review
+from src.reviews.service import review_by_uid
+from src.tags.models import Tag
+from src.tags.service import tag_by_uid
+
+
+uid = str(uuid.uuid4())
+
+LOOKUPS = {
+    'get_user_by_username': (
+        lambda: select(User).where(User.username == 'user1'),
+        user_by_username,
+    ),
+    'get_blog_by_slug': (
+        lambda: select(Blog)
+        .options(joinedload(Blog.author, innerjoin=True))
+        .where(Blog.slug == 'blog-1'),
+        blog_by_slug,
+    ),
+    'get_review_by_uid': (
+        lambda: select(Review)
+        .options(
+            joinedload(Review.author, innerjoin=True),
+            joinedload(Review.blog, innerjoin=True)
+        )
+        .where(Review.uid == uid),
+        review_by_uid,
+    ),
+    'get_tag_by_uid': (
+        lambda: select(Tag).where(Tag.uid == uid),
+        tag_by_uid,
+    ),
+}
+
+
+def compiled_lookup(compiled_cache: dict, dialect, build):
+    def call():
+        statement = build()
+        key = statement._generate_cache_key()
+        compiled = compiled_cache.get(key.key)
+        if compiled is None:
+            compiled_cache[key.key] = statement.compile(dialect=dialect)
+
+    return call
+
+
+def main(args: argparse.Namespace) -> None:
+    configure_mappers()
+    dialect = asyncpg_dialect()
+
+    for name, (inline, prebuilt) in LOOKUPS.items():
+        timings = {}
+        for label, build in (('inline', inline), ('prebuilt', prebuilt)):
+            call = compiled_lookup({}, dialect, build)
+            call()
+            timings[label] = min(timeit.repeat(
+                call, number=args.number, repeat=5
+            )) / args.number * 1_000_000
+
+        print(
+            f'{name:22} inline={timings["inline"]:8.1f}us '
+            f'prebuilt={timings["prebuilt"]:6.2f}us '
+            f'saved={timings["inline"] - timings["prebuilt"]:8.1f}us/call'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20_000)
+    main(parser.parse_args())
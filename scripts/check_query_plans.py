@@ -0,0 +1,318 @@
+"""EXPLAIN every statement the service layer issues and flag bad plans.
+
+Seeds a scratch database, then runs each *Service method and records
+the SQL it sends. Every recorded statement is then EXPLAINed. The run
+fails if a plan contains a sequential scan on a large table the method
+is not allowed to scan, or if its estimated total cost grew by more than
+--tolerance over the stored baseline.
+
+    python -m scripts.check_query_plans --database-url postgresql+asyncpg://... \\
+        [--scale 10k] [--update-baseline] \\
+        [--seq-scan-min-rows 50000] [--seq-scan-min-pages 1000]
+
+A table counts as large once pg_class says it holds at least
+--seq-scan-min-rows rows or --seq-scan-min-pages pages. Below that,
+scanning the whole table is usually what Postgres should do.
+
+Write paths run inside an outer transaction that is rolled back, so the
+seeded data stays identical between methods. tests/test_query_plans.py
+runs the same checks under pytest when TEST_DATABASE_URL is set.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from scripts.seed import SCALES, analyze, reset_schema, seed_database, seed_uid
+from src.auth.schemas import UserCreateRequest, UserPrincipal
+from src.auth.service import UserService, principal_cache
+from src.blog.schemas import BlogCreateRequest, BlogUpdateRequest
+from src.blog.service import BlogService
+from src.reviews.schemas import ReviewBulkItem, ReviewCreateRequest
+from src.reviews.service import ReviewService
+from src.tags.schemas import TagAddRequest, TagCreateRequest
+from src.tags.service import TagService
+
+
+BASELINE_PATH = Path(__file__).with_name('query_plans.json')
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+
+DEFAULT_TOLERANCE = 0.2
+SEQ_SCAN_MIN_ROWS = 50_000
+SEQ_SCAN_MIN_PAGES = 1_000
+
+# Full-table reads where a sequential scan is the right plan.
+ALLOWED_SEQ_SCANS = {
+    'BlogService.stream_all_blogs': {'blogs', 'users'},
+    'ReviewService.stream_all_reviews': {'reviews', 'users', 'blogs'},
+}
+
+user_service = UserService()
+blog_service = BlogService()
+review_service = ReviewService()
+tag_service = TagService()
+
+# The seed gives review 1 to user 18, so this principal may delete it.
+principal = UserPrincipal(
+    uid=seed_uid('user', 18),
+    username='user18',
+    role='user',
+    is_active=True
+)
+
+
+CASES = {
+    'UserService.get_user_by_username':
+        lambda db: user_service.get_user_by_username('user1', db),
+    'UserService.user_exists':
+        lambda db: user_service.user_exists('user1', 'user1@example.com', db),
+    'UserService.get_principal':
+        lambda db: user_service.get_principal('user2', db),
+    'UserService.create_user':
+        lambda db: user_service.create_user(UserCreateRequest(
+            first_name='Plan', last_name='Check', username='plan_check',
+            email='plan_check@example.com', password='password'
+        ), db),
+    'BlogService.get_all_blogs':
+        lambda db: blog_service.get_all_blogs(db),
+    'BlogService.stream_all_blogs':
+        lambda db: _drain(blog_service.stream_all_blogs(db)),
+    'BlogService.get_blog_by_slug':
+        lambda db: blog_service.get_blog_by_slug('blog-10', db),
+    'BlogService.get_blog_detail':
+        lambda db: blog_service.get_blog_detail('blog-10', db),
+    'BlogService.get_user_blogs':
+        lambda db: blog_service.get_user_blogs(principal, db),
+    'BlogService.get_blogs_by_tags':
+        lambda db: blog_service.get_blogs_by_tags(['tag1', 'tag2'], db),
+    'BlogService.get_blogs_by_tags[any]':
+        lambda db: blog_service.get_blogs_by_tags(['tag1', 'tag2'], db, match_all=False),
+    'BlogService.search_blogs':
+        lambda db: blog_service.search_blogs('postgres cache', db),
+    'BlogService.get_top_rated_blogs':
+        lambda db: blog_service.get_top_rated_blogs(db),
+    'BlogService.create_blog':
+        lambda db: blog_service.create_blog(BlogCreateRequest(
+            title='Plan check', description='Plan check',
+            slug='plan-check', publish_date='2024-01-01'
+        ), principal.uid, db),
+    'BlogService.create_blogs':
+        lambda db: blog_service.create_blogs([
+            BlogCreateRequest(
+                title='Plan check', description='Plan check',
+                slug=f'plan-check-{i}', publish_date='2024-01-01'
+            )
+            for i in range(1, 101)
+        ], principal.uid, db),
+    'BlogService.update_blog':
+        lambda db: blog_service.update_blog(
+            'blog-10', BlogUpdateRequest(title='Updated', description='Updated'), db
+        ),
+    'BlogService.delete_blog': (
+        lambda db: blog_service.create_blog(BlogCreateRequest(
+            title='Plan check', description='Plan check',
+            slug='plan-check', publish_date='2024-01-01'
+        ), principal.uid, db),
+        lambda db: blog_service.delete_blog('plan-check', db),
+    ),
+    'ReviewService.get_all_reviews':
+        lambda db: review_service.get_all_reviews(db),
+    'ReviewService.stream_all_reviews':
+        lambda db: _drain(review_service.stream_all_reviews(db)),
+    'ReviewService.get_review_by_uid':
+        lambda db: review_service.get_review_by_uid(str(seed_uid('review', 1)), db),
+    'ReviewService.get_review_detail':
+        lambda db: review_service.get_review_detail(str(seed_uid('review', 1)), db),
+    'ReviewService.add_review_to_blog':
+        lambda db: review_service.add_review_to_blog(
+            ReviewCreateRequest(body='Plan check', rating=4), 'blog-10', principal, db
+        ),
+    'ReviewService.add_reviews':
+        lambda db: review_service.add_reviews([
+            ReviewBulkItem(body='Plan check', rating=4, blog_slug=f'blog-{i}')
+            for i in range(1, 101)
+        ], principal, db),
+    'ReviewService.delete_review':
+        lambda db: review_service.delete_review(str(seed_uid('review', 1)), principal, db),
+    'TagService.get_tags':
+        lambda db: tag_service.get_tags(db),
+    'TagService.get_tag_by_uid':
+        lambda db: tag_service.get_tag_by_uid(str(seed_uid('tag', 1)), db),
+    'TagService.create_tag':
+        lambda db: tag_service.create_tag(TagCreateRequest(title='plan-check'), db),
+    'TagService.add_tag_to_blog':
+        lambda db: tag_service.add_tag_to_blog('blog-10', TagAddRequest(tags=[
+            TagCreateRequest(title=f'tag{i}') for i in range(1, 51)
+        ]), db),
+}
+
+
+async def _drain(rows) -> None:
+    async for _ in rows:
+        pass
+
+
+def _plan_nodes(node: dict):
+    yield node
+    for child in node.get('Plans', []):
+        yield from _plan_nodes(child)
+
+
+async def capture_plans(engine, case) -> list[dict]:
+    """Run one case and EXPLAIN what it sent.
+
+    A case is either a callable taking a session, or a (setup, action)
+    pair where only the action's statements are recorded.
+    """
+    setup, action = case if isinstance(case, tuple) else (None, case)
+    statements = []
+    capturing = False
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if (
+            capturing
+            and not executemany
+            and statement.lstrip().upper().startswith(EXPLAINABLE)
+        ):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            db = AsyncSession(bind=conn, join_transaction_mode='create_savepoint')
+
+            try:
+                if setup is not None:
+                    await setup(db)
+
+                principal_cache.clear()
+                capturing = True
+                await action(db)
+                capturing = False
+
+                plans = []
+                for statement, parameters in statements:
+                    result = await conn.exec_driver_sql(
+                        'EXPLAIN (FORMAT JSON) ' + statement, parameters
+                    )
+                    plan = result.scalar()
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    plans.append({'statement': statement, 'plan': plan[0]['Plan']})
+                return plans
+            finally:
+                await db.close()
+                await transaction.rollback()
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
+async def large_relations(engine, min_rows: int, min_pages: int) -> set[str]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT relname FROM pg_class "
+                "WHERE relkind = 'r' "
+                "AND relnamespace = 'public'::regnamespace "
+                "AND (reltuples >= :min_rows OR relpages >= :min_pages)"
+            ),
+            {'min_rows': min_rows, 'min_pages': min_pages}
+        )
+        return set(result.scalars())
+
+
+def check_plan(
+    name: str,
+    index: int,
+    entry: dict,
+    baseline: dict,
+    tolerance: float,
+    large: set[str]
+):
+    problems = []
+    allowed = ALLOWED_SEQ_SCANS.get(name, set())
+
+    for node in _plan_nodes(entry['plan']):
+        relation = node.get('Relation Name')
+        if (
+            node['Node Type'] == 'Seq Scan'
+            and relation in large
+            and relation not in allowed
+        ):
+            problems.append(f'sequential scan on {relation}')
+
+    key = f'{name}#{index}'
+    cost = entry['plan']['Total Cost']
+    previous = baseline.get(key)
+    if previous is not None and cost > previous * (1 + tolerance):
+        problems.append(f'cost {cost:.1f} exceeds baseline {previous:.1f}')
+
+    return key, cost, problems
+
+
+async def seed(engine, scale: str) -> None:
+    async with engine.begin() as conn:
+        await reset_schema(conn)
+        await seed_database(conn, **SCALES[scale])
+        await analyze(conn)
+
+
+def load_baseline(scale: str) -> dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text()).get(scale, {})
+
+
+async def main(args: argparse.Namespace) -> int:
+    engine = create_async_engine(args.database_url)
+    await seed(engine, args.scale)
+
+    large = await large_relations(
+        engine, args.seq_scan_min_rows, args.seq_scan_min_pages
+    )
+    baseline = {} if args.update_baseline else load_baseline(args.scale)
+
+    costs = {}
+    failures = 0
+    for name, case in CASES.items():
+        plans = await capture_plans(engine, case)
+
+        for index, entry in enumerate(plans):
+            key, cost, problems = check_plan(
+                name, index, entry, baseline, args.tolerance, large
+            )
+            costs[key] = cost
+            status = 'FAIL' if problems else 'ok'
+            print(f'{status:4} {key:45} cost={cost:.1f} {"; ".join(problems)}')
+
+            if problems:
+                failures += 1
+                if args.verbose:
+                    print('     ' + entry['statement'].replace('\n', ' '))
+
+    await engine.dispose()
+
+    if args.update_baseline:
+        stored = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        stored[args.scale] = costs
+        BASELINE_PATH.write_text(json.dumps(stored, indent=2, sort_keys=True) + '\n')
+        print(f'Baseline for {args.scale} written to {BASELINE_PATH}')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--scale', choices=SCALES, default='10k')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--seq-scan-min-rows', type=int, default=SEQ_SCAN_MIN_ROWS)
+    parser.add_argument('--seq-scan-min-pages', type=int, default=SEQ_SCAN_MIN_PAGES)
+    parser.add_argument('--verbose', action='store_true')
+    sys.exit(asyncio.run(main(parser.parse_args())))
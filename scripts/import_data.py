@@ -0,0 +1,231 @@
+"""Bulk-load users, tags, blogs, reviews and blog_tags with COPY.
+
+Each input is NDJSON (.ndjson / .jsonl) or CSV with a header row, one
+record per row, keyed by column name. Files are read in chunks and sent
+with asyncpg's `copy_records_to_table`, all in one transaction.
+
+    python -m scripts.import_data --database-url postgresql+asyncpg://... \\
+        --users users.csv --blogs blogs.ndjson --reviews reviews.ndjson \\
+        [--tags tags.csv] [--blog-tags blog_tags.csv] \\
+        [--chunk-size 10000] [--drop-indexes] [--hash-workers 8]
+
+Columns missing from a record get the model's Python default (uid,
+timestamps, role, ...). A user record may carry a plain `password`
+instead of `hashed_password`; those are hashed in a process pool, and
+--reuse-hashes hashes each distinct password only once, which is fine for
+staging data. With --drop-indexes the non-unique indexes of the target
+tables are dropped before loading and rebuilt afterwards. Blog review
+aggregates are recomputed when reviews are loaded.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator
+from sqlalchemy import Boolean, Table
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from scripts.seed import analyze, refresh_review_aggregates
+from src.auth.utils import generate_password_hash
+from src.db.main import Base
+from src.auth.models import User
+from src.blog.models import Blog
+from src.reviews.models import Review
+from src.tags.models import Tag, BlogTag
+
+
+# Parents before children so foreign keys hold at every step.
+LOAD_ORDER = ('users', 'tags', 'blogs', 'reviews', 'blog_tags')
+
+
+def read_records(path: Path, chunk_size: int) -> Iterator[list[dict]]:
+    with path.open(newline='') as file:
+        if path.suffix == '.csv':
+            rows = (
+                {key: (value if value != '' else None) for key, value in row.items()}
+                for row in csv.DictReader(file)
+            )
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def column_converter(column):
+    """Turn CSV strings into the Python types asyncpg's binary COPY expects."""
+    if isinstance(column.type, Boolean):
+        return lambda value: value if isinstance(value, bool) else (
+            str(value).lower() in ('1', 't', 'true', 'yes')
+        )
+
+    python_type = column.type.python_type
+    parse = {
+        uuid.UUID: uuid.UUID,
+        datetime: datetime.fromisoformat,
+        date: date.fromisoformat,
+    }.get(python_type, python_type)
+
+    return lambda value: value if isinstance(value, python_type) else parse(value)
+
+
+def column_default(column):
+    default = column.default
+    if default is None:
+        return lambda: None
+    if default.is_callable:
+        return lambda: default.arg(None)
+    return lambda: default.arg
+
+
+def loadable_columns(table: Table) -> list:
+    # Generated columns such as blogs.search_vector are filled by Postgres.
+    return [column for column in table.columns if column.computed is None]
+
+
+async def hash_passwords(
+    records: list[dict], pool: ProcessPoolExecutor, reuse: bool
+) -> None:
+    pending = [record for record in records if record.get('password')]
+    if not pending:
+        return
+
+    passwords = [record.pop('password') for record in pending]
+    distinct = list(dict.fromkeys(passwords)) if reuse else passwords
+
+    loop = asyncio.get_running_loop()
+    hashes = await asyncio.gather(*(
+        loop.run_in_executor(pool, generate_password_hash, password)
+        for password in distinct
+    ))
+
+    if reuse:
+        by_password = dict(zip(distinct, hashes))
+        hashes = [by_password[password] for password in passwords]
+
+    for record, hashed_password in zip(pending, hashes):
+        record['hashed_password'] = hashed_password
+
+
+async def copy_table(
+    conn: AsyncConnection,
+    table: Table,
+    path: Path,
+    chunk_size: int,
+    pool: ProcessPoolExecutor,
+    reuse_hashes: bool
+) -> int:
+    columns = loadable_columns(table)
+    names = [column.name for column in columns]
+    converters = [column_converter(column) for column in columns]
+    defaults = [column_default(column) for column in columns]
+
+    raw_connection = await conn.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    total = 0
+    for chunk in read_records(path, chunk_size):
+        if table.name == 'users':
+            await hash_passwords(chunk, pool, reuse_hashes)
+
+        records = []
+        for record in chunk:
+            values = []
+            for name, convert, default in zip(names, converters, defaults):
+                value = record.get(name)
+                values.append(default() if value is None else convert(value))
+            records.append(tuple(values))
+
+        await driver_connection.copy_records_to_table(
+            table.name, records=records, columns=names
+        )
+        total += len(records)
+
+    return total
+
+
+def secondary_indexes(tables: list[Table]) -> list:
+    return [
+        index
+        for table in tables
+        for index in sorted(table.indexes, key=lambda index: index.name)
+        if not index.unique
+    ]
+
+
+async def main(args: argparse.Namespace) -> None:
+    files = {
+        'users': args.users,
+        'tags': args.tags,
+        'blogs': args.blogs,
+        'reviews': args.reviews,
+        'blog_tags': args.blog_tags,
+    }
+    tables = [
+        Base.metadata.tables[name] for name in LOAD_ORDER if files[name]
+    ]
+
+    engine = create_async_engine(args.database_url)
+    started_at = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.hash_workers) as pool:
+        async with engine.begin() as conn:
+            indexes = secondary_indexes(tables) if args.drop_indexes else []
+            for index in indexes:
+                await conn.execute(DropIndex(index, if_exists=True))
+
+            for table in tables:
+                table_started_at = time.perf_counter()
+                rows = await copy_table(
+                    conn, table, Path(files[table.name]),
+                    args.chunk_size, pool, args.reuse_hashes
+                )
+                elapsed = time.perf_counter() - table_started_at
+                print(
+                    f'{table.name:10} {rows:>12,} rows in {elapsed:8.1f}s '
+                    f'({rows / elapsed if elapsed else 0:,.0f} rows/s)'
+                )
+
+            if indexes:
+                index_started_at = time.perf_counter()
+                for index in indexes:
+                    await conn.execute(CreateIndex(index))
+                print(
+                    f'Rebuilt {len(indexes)} indexes in '
+                    f'{time.perf_counter() - index_started_at:.1f}s'
+                )
+
+            if files['reviews']:
+                await refresh_review_aggregates(conn)
+            await analyze(conn)
+
+    await engine.dispose()
+    print(f'Import finished in {time.perf_counter() - started_at:.1f}s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--users')
+    parser.add_argument('--tags')
+    parser.add_argument('--blogs')
+    parser.add_argument('--reviews')
+    parser.add_argument('--blog-tags')
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--drop-indexes', action='store_true')
+    parser.add_argument('--hash-workers', type=int)
+    parser.add_argument('--reuse-hashes', action='store_true')
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,160 @@
+"""Generate a synthetic dataset directly in Postgres.
+
+Rows are produced with generate_series and given deterministic uids
+(md5 of a per-table prefix and row number). That way related rows can
+be linked by arithmetic instead of lookups, and a million-row seed takes
+seconds.
+Every seeded user has the password `password`.
+"""
+import argparse
+import asyncio
+import hashlib
+import uuid
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.auth.utils import generate_password_hash
+from src.db.main import Base
+from src.auth.models import User
+from src.blog.models import Blog
+from src.reviews.models import Review
+from src.tags.models import Tag, BlogTag
+
+
+SCALES = {
+    '10k': {'users': 1_000, 'blogs': 10_000, 'reviews': 40_000, 'tags': 200},
+    '100k': {'users': 10_000, 'blogs': 100_000, 'reviews': 400_000, 'tags': 1_000},
+    '1m': {'users': 100_000, 'blogs': 1_000_000, 'reviews': 4_000_000, 'tags': 5_000},
+}
+
+WORDS = (
+    'python', 'async', 'postgres', 'fastapi', 'index', 'cache', 'query',
+    'latency', 'deploy', 'docker', 'testing', 'design', 'review', 'stream',
+    'cursor', 'search', 'tuning', 'replica', 'pool', 'schema'
+)
+
+
+def seed_uid(prefix: str, i: int) -> uuid.UUID:
+    """Python mirror of the `md5(prefix || i)::uuid` expression used below."""
+    return uuid.UUID(hashlib.md5(f'{prefix}{i}'.encode()).hexdigest())
+
+
+async def reset_schema(conn: AsyncConnection) -> None:
+    await conn.run_sync(Base.metadata.drop_all)
+    await conn.run_sync(Base.metadata.create_all)
+
+
+async def seed_database(
+    conn: AsyncConnection,
+    users: int,
+    blogs: int,
+    reviews: int,
+    tags: int,
+    tags_per_blog: int = 3
+) -> None:
+    users, blogs, reviews, tags = int(users), int(blogs), int(reviews), int(tags)
+    words = 'ARRAY[' + ', '.join(f"'{word}'" for word in WORDS) + ']'
+    hashed_password = generate_password_hash('password')
+
+    await conn.execute(
+        text(f'''
+            INSERT INTO users (
+                uid, username, email, first_name, last_name, hashed_password,
+                is_active, role, datetime_created, datetime_updated
+            )
+            SELECT md5('user' || i)::uuid, 'user' || i, 'user' || i || '@example.com',
+                   'First' || i, 'Last' || i, :hashed_password,
+                   true, 'user', now() - make_interval(secs => i), now()
+            FROM generate_series(1, {users}) AS i
+        '''),
+        {'hashed_password': hashed_password}
+    )
+    await conn.execute(text(f'''
+        INSERT INTO blogs (
+            uid, title, description, slug, publish_date,
+            datetime_created, datetime_updated, author_uid
+        )
+        SELECT md5('blog' || i)::uuid,
+               initcap(w[1 + i % 20]) || ' and ' || w[1 + (i / 20) % 20] || ' #' || i,
+               'Notes on ' || w[1 + (i * 7) % 20] || ', ' || w[1 + (i * 11) % 20]
+                   || ' and ' || w[1 + (i * 13) % 20] || ' from post ' || i,
+               'blog-' || i,
+               current_date - (i % 1000),
+               now() - make_interval(secs => i),
+               now(),
+               md5('user' || (1 + floor({users} * random() ^ 2)::int))::uuid
+        FROM generate_series(1, {blogs}) AS i, (SELECT {words} AS w) AS words
+    '''))
+    await conn.execute(text(f'''
+        INSERT INTO reviews (
+            uid, body, rating, datetime_created, datetime_updated,
+            author_uid, blog_uid
+        )
+        SELECT md5('review' || i)::uuid,
+               'Review ' || i,
+               1 + (i * 31) % 5,
+               now() - make_interval(secs => i),
+               now(),
+               md5('user' || (1 + (i * 17) % {users}))::uuid,
+               md5('blog' || (1 + floor({blogs} * random() ^ 2)::int))::uuid
+        FROM generate_series(1, {reviews}) AS i
+    '''))
+    await conn.execute(text(f'''
+        INSERT INTO tags (uid, title, datetime_created, datetime_updated)
+        SELECT md5('tag' || i)::uuid, 'tag' || i,
+               now() - make_interval(secs => i), now()
+        FROM generate_series(1, {tags}) AS i
+    '''))
+    await conn.execute(text(f'''
+        INSERT INTO blog_tags (blog_uid, tag_uid)
+        SELECT md5('blog' || b)::uuid,
+               md5('tag' || (1 + floor({tags} * random() ^ 2)::int))::uuid
+        FROM generate_series(1, {blogs}) AS b,
+             generate_series(1, {int(tags_per_blog)}) AS k
+        ON CONFLICT DO NOTHING
+    '''))
+    await refresh_review_aggregates(conn)
+
+
+async def refresh_review_aggregates(conn: AsyncConnection) -> None:
+    """Recompute `blogs.review_count` / `rating_sum` from the reviews table."""
+    await conn.execute(text('''
+        UPDATE blogs
+        SET review_count = totals.review_count,
+            rating_sum = totals.rating_sum
+        FROM (
+            SELECT blog_uid,
+                   count(*) AS review_count,
+                   coalesce(sum(rating), 0) AS rating_sum
+            FROM reviews
+            GROUP BY blog_uid
+        ) AS totals
+        WHERE blogs.uid = totals.blog_uid
+    '''))
+
+
+async def analyze(conn: AsyncConnection) -> None:
+    for table in ('users', 'blogs', 'reviews', 'tags', 'blog_tags'):
+        await conn.execute(text(f'ANALYZE {table}'))
+
+
+async def main(args: argparse.Namespace) -> None:
+    sizes = SCALES[args.scale]
+    engine = create_async_engine(args.database_url)
+
+    async with engine.begin() as conn:
+        await reset_schema(conn)
+        await seed_database(conn, **sizes)
+        await analyze(conn)
+
+    await engine.dispose()
+    print(f'Seeded {args.scale}: {sizes}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Drop, recreate and seed a scratch database.'
+    )
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--scale', choices=SCALES, default='10k')
+    asyncio.run(main(parser.parse_args()))
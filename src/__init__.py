@@ -2,8 +2,12 @@ from fastapi import FastAPI
 
 from src.auth.routers import auth_router
 from src.blog.routers import blog_router
+from src.db.routers import db_router
 from src.errors import register_all_errors
+from src.lifespan import lifespan
+from src.middleware import register_middleware
 from src.reviews.routers import review_router
+from src.serialization import FastJSONResponse
 from src.tags.routers import tags_router
 
 
@@ -12,10 +16,13 @@ version = 'v1'
 app = FastAPI(
     title='Blog',
     description='A REST API for a blog service',
-    version=version
+    version=version,
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 register_all_errors(app)
+register_middleware(app)
 
 app.include_router(
     auth_router,
@@ -40,3 +47,9 @@ app.include_router(
     prefix=f'/api/{version}/tags',
     tags=['tags']
 )
+
+app.include_router(
+    db_router,
+    prefix=f'/api/{version}/db',
+    tags=['db']
+)
@@ -1,17 +1,23 @@
-from typing import Annotated
+import hashlib
+from typing import Annotated, List
 from fastapi import Depends, Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.revocation import revocation_list
+from src.auth.schemas import UserPrincipal
 from src.auth.service import UserService
 from src.auth.utils import decode_token
+from src.cache import LRUCache
 from src.config import Config
 from src.db.main import get_session
 from src.errors import (
     AccessTokenRequired, 
+    InsufficientPermission,
     InvalidScheme, 
     InvalidToken, 
-    RefreshTokenRequired
+    RefreshTokenRequired,
+    UserNotFound
 )
 
 
@@ -19,6 +25,20 @@ JWT_SECRET = Config.JWT_SECRET
 JWT_ALGORITHM = Config.JWT_ALGORITHM
 
 user_service = UserService()
+token_cache = LRUCache(maxsize=Config.TOKEN_CACHE_SIZE)
+
+
+def decode_token_cached(token: str) -> dict | None:
+    key = hashlib.sha256(token.encode()).digest()
+    token_data = token_cache.get(key)
+
+    if token_data is None:
+        token_data = decode_token(token)
+
+        if token_data is not None:
+            token_cache.set(key, token_data, expires_at=token_data.get('exp'))
+
+    return token_data
 
 
 class TokenBearer(HTTPBearer):
@@ -29,22 +49,23 @@ class TokenBearer(HTTPBearer):
         credentials: HTTPAuthorizationCredentials = await super().__call__(request)
         token = credentials.credentials
         scheme = credentials.scheme
-        token_data = decode_token(token)
+        token_data = decode_token_cached(token)
 
         if not scheme == 'Bearer':
             raise InvalidScheme()
 
-        if not self.valid_token(token):
+        if not self.valid_token(token_data):
             raise InvalidToken()
 
         self.verify_token_data(token_data)
 
         return token_data
 
-    def valid_token(self, token: str) -> bool:
-        token_data = decode_token(token)
-
-        return token_data is not None
+    def valid_token(self, token_data: dict | None) -> bool:
+        return (
+            token_data is not None
+            and not revocation_list.is_revoked(token_data.get('jti'))
+        )
 
 
 class AccessTokenBearer(TokenBearer):
@@ -67,3 +88,29 @@ async def get_current_user(
     user = await user_service.get_user_by_username(username, db)
 
     return user
+
+
+async def get_current_principal(
+    token: Annotated[dict, Depends(AccessTokenBearer())],
+    db: Annotated[AsyncSession, Depends(get_session)]
+):
+    username = token.get('sub')
+    principal = await user_service.get_principal(username, db)
+
+    if not principal:
+        raise UserNotFound()
+
+    return principal
+
+
+class RoleChecker:
+    def __init__(self, allowed_roles: List[str]) -> None:
+        self.allowed_roles = allowed_roles
+
+    async def __call__(
+        self, principal: Annotated[UserPrincipal, Depends(get_current_principal)]
+    ) -> UserPrincipal:
+        if principal.role not in self.allowed_roles:
+            raise InsufficientPermission()
+
+        return principal
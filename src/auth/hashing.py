@@ -0,0 +1,118 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.auth.utils import generate_password_hash, verify_password
+from src.config import Config
+from src.errors import PasswordHasherBusy
+
+
+class Timing:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'avg_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'max_ms': self.max * 1000,
+        }
+
+
+class PasswordHasher:
+    """Runs bcrypt in an executor so hashing never blocks the event loop.
+
+    At most `max_workers` hashes run at once; up to `max_queue` more may
+    wait for a slot, and anything beyond that is rejected with
+    `PasswordHasherBusy` instead of piling up behind a login burst.
+    """
+
+    def __init__(
+        self, executor: str = 'thread', max_workers: int = 4, max_queue: int = 64
+    ) -> None:
+        self._executor_kind = executor
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._waiting = 0
+        self.rejected = 0
+        self.queue_wait = Timing()
+        self.hash_time = Timing()
+
+    def init(self) -> None:
+        """Start the executor. Called on startup, or by the first hash."""
+        if self._executor is not None:
+            return
+
+        if self._executor_kind == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix='bcrypt'
+            )
+        self._semaphore = asyncio.Semaphore(self._max_workers)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(generate_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def _run(self, func, *args):
+        self.init()
+        executor, semaphore = self._executor, self._semaphore
+
+        if self._waiting >= self._max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+
+        self._waiting += 1
+        queued_at = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        started_at = time.perf_counter()
+        self.queue_wait.observe(started_at - queued_at)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        finally:
+            self.hash_time.observe(time.perf_counter() - started_at)
+            semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            'max_workers': self._max_workers,
+            'max_queue': self._max_queue,
+            'waiting': self._waiting,
+            'rejected': self.rejected,
+            'queue_wait': self.queue_wait.as_dict(),
+            'hash_time': self.hash_time.as_dict(),
+        }
+
+    def close(self) -> None:
+        """Shut the executor down; the next init() starts a fresh one."""
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._semaphore = None
+
+
+password_hasher = PasswordHasher(
+    Config.PASSWORD_HASHER_EXECUTOR,
+    Config.PASSWORD_HASHER_WORKERS,
+    Config.PASSWORD_HASHER_MAX_QUEUE
+)
@@ -25,14 +25,27 @@ class User(Base):
     is_active = Column(Boolean, default=False)
     role = Column(String, default='user')
     datetime_created = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
     datetime_updated = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
 
-    blogs = relationship(Blog, back_populates='author', lazy='selectin')
-    reviews = relationship(Review, back_populates='author', lazy='selectin')
+    blogs = relationship(Blog, back_populates='author')
+    reviews = relationship(Review, back_populates='author')
 
     def __repr__(self):
         return f'<User {self.username}>'
+
+
+class RevokedToken(Base):
+    __tablename__ = 'revoked_tokens'
+
+    jti = Column(pg.UUID, primary_key=True)
+    expires_at = Column(pg.TIMESTAMP, nullable=False, index=True)
+    datetime_created = Column(
+        pg.TIMESTAMP, default=datetime.now, nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f'<RevokedToken {self.jti}>'
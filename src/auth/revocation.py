@@ -0,0 +1,86 @@
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import RevokedToken
+
+
+# Rows can commit slightly out of datetime_created order, and workers'
+# clocks drift, so each incremental read reaches back this far.
+REFRESH_OVERLAP = timedelta(seconds=30)
+
+
+class RevocationList:
+    """Revoked token ids kept in memory, so checking one is a dict lookup.
+
+    Each worker loads the unexpired rows on startup and then only reads
+    rows created since its last refresh. A jti is forgotten once its token
+    has expired, since the token is rejected on `exp` from then on anyway.
+    """
+
+    def __init__(self) -> None:
+        self._revoked: dict[str, float] = {}
+        self._refreshed_at: datetime | None = None
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._revoked
+
+    async def refresh(self, db: AsyncSession) -> None:
+        now = datetime.now()
+        statement = select(RevokedToken.jti, RevokedToken.expires_at).where(
+            RevokedToken.expires_at > now
+        )
+
+        if self._refreshed_at is not None:
+            statement = statement.where(
+                RevokedToken.datetime_created >= self._refreshed_at - REFRESH_OVERLAP
+            )
+
+        rows = await db.execute(statement)
+        for jti, expires_at in rows:
+            self._revoked[str(jti)] = expires_at.timestamp()
+
+        self._refreshed_at = now
+        self.prune()
+
+    def prune(self) -> None:
+        now = time.time()
+        expired = [jti for jti, exp in self._revoked.items() if exp <= now]
+
+        for jti in expired:
+            del self._revoked[jti]
+
+    async def revoke(self, token_data: dict, db: AsyncSession) -> None:
+        jti = token_data.get('jti')
+
+        # Tokens issued before jti was added cannot be revoked individually.
+        if jti is None:
+            return
+
+        await db.execute(
+            insert(RevokedToken)
+            .values(
+                jti=jti,
+                expires_at=datetime.fromtimestamp(token_data['exp']),
+                datetime_created=datetime.now()
+            )
+            .on_conflict_do_nothing()
+        )
+        await db.commit()
+        self._revoked[jti] = token_data['exp']
+
+    async def delete_expired(self, db: AsyncSession) -> None:
+        await db.execute(
+            delete(RevokedToken)
+            .where(RevokedToken.expires_at <= datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_list = RevocationList()
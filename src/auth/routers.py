@@ -1,16 +1,26 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import JSONResponse
 from typing import Annotated
 
 from src.auth.models import User
-from src.auth.utils import create_access_token, generate_password_hash, verify_password
+from src.auth.hashing import password_hasher
+from src.auth.revocation import revocation_list
+from src.auth.throttling import login_throttle
+from src.auth.utils import create_access_token, decode_token
 from src.db.main import get_session
 from src.config import Config
-from src.auth.schemas import UserChangePasswordRequest, UserCreateRequest, UserDetailModel, UserLoginModel
+from src.auth.schemas import (
+    LogoutRequest,
+    UserChangePasswordRequest,
+    UserCreateRequest,
+    UserDetailModel,
+    UserLoginModel
+)
 from src.auth.service import UserService
-from src.auth.dependencies import RefreshTokenBearer, get_current_user
+from src.auth.dependencies import AccessTokenBearer, RefreshTokenBearer, get_current_user
+from src.serialization import model_response
 from src.errors import (
     InvalidCredantials,
     InvalidToken,
@@ -32,12 +42,19 @@ user_service = UserService()
     status_code=status.HTTP_200_OK
 )
 async def login_for_access_token(
+    request: Request,
     login_request: UserLoginModel,
     db: db_dependency
 ):
+    await login_throttle.check(
+        login_request.username, request.client.host if request.client else None
+    )
+
     user = await user_service.get_user_by_username(login_request.username, db)
 
-    if not user or not verify_password(login_request.password, user.hashed_password):
+    if not user or not await password_hasher.verify(
+        login_request.password, user.hashed_password
+    ):
         raise InvalidCredantials()
 
     access_token = create_access_token(
@@ -80,7 +97,9 @@ async def create_user_account(
 
     new_user = await user_service.create_user(user_request, db)
 
-    return new_user
+    return model_response(
+        UserDetailModel, new_user, status.HTTP_201_CREATED
+    )
 
 
 @auth_router.get(
@@ -107,6 +126,36 @@ async def get_new_access_token(
     raise InvalidToken()
 
 
+@auth_router.post(
+    '/logout',
+    status_code=status.HTTP_200_OK
+)
+async def logout(
+    token_data: Annotated[dict, Depends(AccessTokenBearer())],
+    db: db_dependency,
+    logout_request: LogoutRequest | None = None
+):
+    await revocation_list.revoke(token_data, db)
+
+    if logout_request and logout_request.refresh_token:
+        refresh_data = decode_token(logout_request.refresh_token)
+
+        if (
+            not refresh_data
+            or not refresh_data.get('refresh')
+            or refresh_data.get('sub') != token_data.get('sub')
+        ):
+            raise InvalidToken()
+
+        await revocation_list.revoke(refresh_data, db)
+
+    return JSONResponse(
+        content={
+            'message': 'Logged out successfully'
+        }
+    )
+
+
 @auth_router.post(
     '/change_password',
     status_code=status.HTTP_200_OK
@@ -120,13 +169,13 @@ async def change_account_password(
     new_password = user_request.new_password
     confirm_new_password = user_request.confirm_new_password
 
-    if not verify_password(old_password, current_user.hashed_password):
+    if not await password_hasher.verify(old_password, current_user.hashed_password):
         raise PasswordIncorrect()
 
     if not new_password == confirm_new_password:
         raise PasswordNotMatch()
 
-    hashed_password = generate_password_hash(new_password)
+    hashed_password = await password_hasher.hash(new_password)
     await user_service.update_user(
         current_user, {'hashed_password': hashed_password}, db
     )
@@ -147,4 +196,4 @@ async def change_account_password(
 async def get_current_user(
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    return current_user
+    return model_response(UserDetailModel, current_user)
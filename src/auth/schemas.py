@@ -15,6 +15,13 @@ class UserDetailModel(UserShowModel):
     is_active: bool
 
 
+class UserPrincipal(BaseModel):
+    uid: uuid.UUID
+    username: str
+    role: str
+    is_active: bool
+
+
 class UserLoginModel(BaseModel):
     username: str
     password: str
@@ -28,6 +35,10 @@ class UserCreateRequest(BaseModel):
     password: str = Field(min_length=6, exclude=True)
 
 
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
+
+
 class UserChangePasswordRequest(BaseModel):
     old_password: str
     new_password: str
@@ -1,20 +1,51 @@
+from functools import cache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, select
 
-from src.auth.schemas import UserCreateRequest
+from src.auth.schemas import UserCreateRequest, UserPrincipal
 from src.auth.models import User
-from src.auth.utils import generate_password_hash
+from src.auth.hashing import password_hasher
+from src.cache import LRUCache
+from src.config import Config
+
+
+principal_cache = LRUCache(
+    maxsize=Config.PRINCIPAL_CACHE_SIZE, ttl=Config.PRINCIPAL_CACHE_TTL
+)
+
+
+# Hot lookups are built once, on first use (loader options need configured
+# mappers), with bound parameters. A statement object memoizes its cache
+# key, so later calls go straight to SQLAlchemy's compiled cache instead
+# of rebuilding and re-keying the construct.
+@cache
+def user_by_username() -> Select:
+    return select(User).where(User.username == bindparam('username'))
 
 
 class UserService:
     async def get_user_by_username(
         self, username: str, db: AsyncSession
     ):
-        user = await db.execute(
-            select(User).where(User.username == username)
-        )
+        user = await db.execute(user_by_username(), {'username': username})
         return user.scalars().first()
 
+    async def get_principal(
+        self, username: str, db: AsyncSession
+    ):
+        principal = principal_cache.get(username)
+
+        if principal is None:
+            user = await self.get_user_by_username(username, db)
+
+            if not user:
+                return None
+
+            principal = UserPrincipal.model_validate(user, from_attributes=True)
+            principal_cache.set(username, principal)
+
+        return principal
+
     async def user_exists(
         self, username: str, email: str, db: AsyncSession
     ):
@@ -29,7 +60,7 @@ class UserService:
         user_data_dict = user_request.model_dump()
         new_user = User(
             **user_data_dict,
-            hashed_password=generate_password_hash(user_request.password)
+            hashed_password=await password_hasher.hash(user_request.password)
         )
         db.add(new_user)
         await db.commit()
@@ -39,9 +70,12 @@ class UserService:
     async def update_user(
         self, user: User, user_data: dict, db: AsyncSession
     ):
+        username = user.username
+
         for k, v in user_data.items():
             setattr(user, k, v)
         
         await db.commit()
         await db.refresh(user)
-        return user 
+        principal_cache.delete(username)
+        return user
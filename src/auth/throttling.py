@@ -0,0 +1,110 @@
+import time
+
+from src.cache import LRUCache
+from src.config import Config
+from src.errors import TooManyLoginAttempts
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+
+# Refill, take one token and store the bucket in a single round trip so
+# concurrent workers cannot both spend the last token.
+TAKE_TOKEN_SCRIPT = '''
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - updated_at) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+return allowed
+'''
+
+
+class MemoryBucketStore:
+    """Token buckets for one worker, as (tokens, updated_at) LRU entries.
+
+    Each entry expires when its bucket would be full again, at which
+    point a missing entry means the same thing, so idle keys cost nothing.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._buckets = LRUCache(maxsize)
+
+    async def take(self, key: str, capacity: int, rate: float) -> bool:
+        now = time.time()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+
+        self._buckets.set(
+            key, (tokens, now), expires_at=now + (capacity - tokens) / rate
+        )
+        return allowed
+
+
+class RedisBucketStore:
+    """Token buckets shared by every worker through Redis."""
+
+    def __init__(self, url: str) -> None:
+        if redis is None:
+            raise RuntimeError('LOGIN_THROTTLE_REDIS_URL requires the redis package')
+
+        self._client = redis.from_url(url)
+        self._take = self._client.register_script(TAKE_TOKEN_SCRIPT)
+
+    async def take(self, key: str, capacity: int, rate: float) -> bool:
+        allowed = await self._take(keys=[key], args=[capacity, rate, time.time()])
+        return bool(allowed)
+
+
+class LoginThrottle:
+    def __init__(
+        self,
+        store: MemoryBucketStore | RedisBucketStore,
+        username_burst: int,
+        username_per_minute: float,
+        ip_burst: int,
+        ip_per_minute: float
+    ) -> None:
+        self._store = store
+        self._username_limit = (username_burst, username_per_minute / 60)
+        self._ip_limit = (ip_burst, ip_per_minute / 60)
+        self.rejected = 0
+
+    async def check(self, username: str, ip: str | None) -> None:
+        """Spend one token per IP and per username, or raise."""
+        allowed = await self._store.take(f'login:ip:{ip}', *self._ip_limit)
+
+        if allowed:
+            allowed = await self._store.take(
+                f'login:user:{username.lower()}', *self._username_limit
+            )
+
+        if not allowed:
+            self.rejected += 1
+            raise TooManyLoginAttempts()
+
+
+login_throttle = LoginThrottle(
+    RedisBucketStore(Config.LOGIN_THROTTLE_REDIS_URL)
+    if Config.LOGIN_THROTTLE_REDIS_URL
+    else MemoryBucketStore(Config.LOGIN_THROTTLE_CACHE_SIZE),
+    Config.LOGIN_USERNAME_BURST,
+    Config.LOGIN_USERNAME_PER_MINUTE,
+    Config.LOGIN_IP_BURST,
+    Config.LOGIN_IP_PER_MINUTE
+)
@@ -1,3 +1,4 @@
+import uuid
 import jwt
 from fastapi import Depends
 from typing import Annotated
@@ -43,7 +44,12 @@ def create_access_token(
     username: str, role: str, refresh: bool = False, expires_delta: timedelta | None = None
 ) -> str:
     
-    payload = {'sub': username, 'role': role, 'refresh': refresh}
+    payload = {
+        'sub': username,
+        'role': role,
+        'refresh': refresh,
+        'jti': str(uuid.uuid4())
+    }
     if expires_delta:
         expires = datetime.now() + expires_delta
     else:
@@ -1,8 +1,12 @@
 import uuid
-from sqlalchemy import Column, String, Date, ForeignKey
+from sqlalchemy import (
+    Column, Computed, String, Date, ForeignKey, Index, Integer, Numeric, cast, func,
+    literal_column
+)
 import sqlalchemy.dialects.postgresql as pg
 from datetime import datetime
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred, relationship
 
 from src.db.main import Base
 
@@ -23,21 +27,58 @@ class Blog(Base):
     slug = Column(String, nullable=False, unique=True)
     publish_date = Column(Date)
     datetime_created = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
     datetime_updated = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
 
+    search_vector = deferred(Column(
+        pg.TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        )
+    ))
+    review_count = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_sum = Column(Integer, nullable=False, default=0, server_default='0')
+
     author_uid = Column(
         pg.UUID, ForeignKey('users.uid'), nullable=False
     )
 
-    author = relationship(User, back_populates='blogs', lazy='selectin')
-    reviews = relationship(Review, back_populates='blog', lazy='selectin')
+    author = relationship(User, back_populates='blogs')
+    reviews = relationship(Review, back_populates='blog')
     tags = relationship(
-        'Tag', secondary='blog_tags', back_populates='blogs', lazy='selectin'
+        'Tag', secondary='blog_tags', back_populates='blogs'
+    )
+
+    __table_args__ = (
+        Index('ix_blogs_datetime_created_uid', 'datetime_created', 'uid'),
+        Index(
+            'ix_blogs_author_uid_datetime_created_uid',
+            'author_uid', 'datetime_created', 'uid'
+        ),
+        Index('ix_blogs_search_vector', 'search_vector', postgresql_using='gin'),
     )
 
+    @hybrid_property
+    def average_rating(self):
+        return (self.rating_sum or 0) / max(self.review_count or 0, 1)
+
+    @average_rating.expression
+    def average_rating(cls):
+        return cast(cls.rating_sum, Numeric) / func.greatest(
+            cls.review_count, literal_column('1')
+        )
+
     def __repr__(self):
         return f'<Book {self.title}>'
+
+
+Index(
+    'ix_blogs_average_rating_uid',
+    Blog.average_rating.self_group().desc(),
+    Blog.uid.desc()
+)
@@ -1,46 +1,116 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from functools import partial
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated, List
-
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
-from src.blog.schemas import BlogCreateRequest, BlogDetailModel, BlogUpdateRequest, BlogShowModel
+from typing import Annotated, List, Literal
+
+from src.auth.dependencies import get_current_principal
+from src.auth.schemas import UserPrincipal
+from src.blog.schemas import (
+    BlogBulkCreateRequest,
+    BlogCreateRequest,
+    BlogDetailModel,
+    BlogSearchResult,
+    BlogShowModel,
+    BlogUpdateRequest,
+    BulkCreateResponse
+)
 from src.blog.service import BlogService
-from src.db.main import get_session
+from src.db.main import get_read_session, get_session, reads_own_writes
 from src.errors import BlogNotFound
+from src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from src.serialization import model_response
+from src.streaming import ndjson_response, wants_ndjson
 
 
 blog_router = APIRouter()
 
 blog_service = BlogService()
 db_dependency = Annotated[AsyncSession, Depends(get_session)]
-user_dependency = Annotated[User, Depends(get_current_user)]
+read_db_dependency = Annotated[AsyncSession, Depends(get_read_session)]
+user_dependency = Annotated[UserPrincipal, Depends(get_current_principal)]
 
 
 @blog_router.get(
     '/',
     status_code=status.HTTP_200_OK,
-    response_model=List[BlogDetailModel]
+    response_model=Page[BlogDetailModel]
 )
 async def get_all_blogs(
-    db: db_dependency
+    request: Request,
+    db: read_db_dependency,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    tags: str | None = None,
+    match: Literal['all', 'any'] = 'all'
 ):
-    blogs = await blog_service.get_all_blogs(db)
-    return blogs
+    tag_titles = list(dict.fromkeys(
+        title.strip() for title in (tags or '').split(',') if title.strip()
+    ))
+
+    if wants_ndjson(request):
+        return ndjson_response(
+            partial(
+                blog_service.stream_all_blogs,
+                tags=tag_titles,
+                match_all=(match == 'all')
+            ),
+            BlogDetailModel,
+            read_only=not reads_own_writes(request)
+        )
+
+    if tag_titles:
+        blogs = await blog_service.get_blogs_by_tags(
+            tag_titles, db, limit, cursor, match_all=(match == 'all')
+        )
+        return model_response(Page[BlogDetailModel], blogs)
+
+    blogs = await blog_service.get_all_blogs(db, limit, cursor)
+    return model_response(Page[BlogDetailModel], blogs)
 
 
 @blog_router.get(
     '/user_blogs',
     status_code=status.HTTP_200_OK,
-    response_model=List[BlogDetailModel]
+    response_model=Page[BlogDetailModel]
 )
 async def get_user_blogs(
-    db: db_dependency,
-    user: user_dependency
+    db: read_db_dependency,
+    user: user_dependency,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
+):
+    blogs = await blog_service.get_user_blogs(user, db, limit, cursor)
+    return model_response(Page[BlogDetailModel], blogs)
+
+
+@blog_router.get(
+    '/search',
+    status_code=status.HTTP_200_OK,
+    response_model=Page[BlogSearchResult]
+)
+async def search_blogs(
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    db: read_db_dependency,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
 ):
-    blogs = await blog_service.get_user_blogs(user, db)
-    return blogs
+    results = await blog_service.search_blogs(q, db, limit, cursor)
+    return model_response(Page[BlogSearchResult], results)
+
+
+@blog_router.get(
+    '/top_rated',
+    status_code=status.HTTP_200_OK,
+    response_model=List[BlogDetailModel]
+)
+async def get_top_rated_blogs(
+    db: read_db_dependency,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    min_reviews: Annotated[int, Query(ge=0)] = 1
+):
+    blogs = await blog_service.get_top_rated_blogs(db, limit, min_reviews)
+    return model_response(List[BlogDetailModel], blogs)
 
 
 @blog_router.get(
@@ -50,14 +120,14 @@ async def get_user_blogs(
 )
 async def get_blog(
     blog_slug: str,
-    db: db_dependency
+    db: read_db_dependency
 ):
-    blog = await blog_service.get_blog_by_slug(blog_slug, db)
+    content = await blog_service.get_blog_detail_json(blog_slug, db)
 
-    if not blog:
+    if not content:
         raise BlogNotFound()
 
-    return blog
+    return Response(content=content, media_type='application/json')
 
 
 @blog_router.post(
@@ -73,7 +143,23 @@ async def create_blog(
     blog = await blog_service.create_blog(
         blog_request, user.uid, db
     )
-    return blog
+    return model_response(BlogDetailModel, blog, status.HTTP_201_CREATED)
+
+
+@blog_router.post(
+    '/bulk',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkCreateResponse
+)
+async def create_blogs(
+    bulk_request: BlogBulkCreateRequest,
+    user: user_dependency,
+    db: db_dependency,
+):
+    results = await blog_service.create_blogs(
+        bulk_request.blogs, user.uid, db
+    )
+    return model_response(BulkCreateResponse, results)
 
 
 @blog_router.put(
@@ -94,7 +180,7 @@ async def update_blog(
     if not blog:
         raise BlogNotFound()
 
-    return blog
+    return model_response(BlogDetailModel, blog, status.HTTP_202_ACCEPTED)
 
 
 @blog_router.delete(
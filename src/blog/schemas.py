@@ -1,7 +1,10 @@
+import uuid
 from datetime import date, datetime
-from pydantic import BaseModel
+from typing import List, Literal
+from pydantic import BaseModel, Field
 
 from src.auth.schemas import UserShowModel
+from src.config import Config
 
 
 class BlogShowModel(BaseModel):
@@ -14,9 +17,19 @@ class BlogShowModel(BaseModel):
 
 
 class BlogDetailModel(BlogShowModel):
+    review_count: int
+    average_rating: float
     author: 'UserShowModel'
 
 
+class BlogSearchResult(BaseModel):
+    title: str
+    slug: str
+    publish_date: date
+    rank: float
+    snippet: str
+
+
 class BlogCreateRequest(BaseModel):
     title: str
     description: str
@@ -24,6 +37,25 @@ class BlogCreateRequest(BaseModel):
     publish_date: str
 
 
+class BlogBulkCreateRequest(BaseModel):
+    blogs: List[BlogCreateRequest] = Field(
+        min_length=1, max_length=Config.BULK_CREATE_MAX_ITEMS
+    )
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: Literal['created', 'failed']
+    uid: uuid.UUID | None = None
+    error_code: str | None = None
+
+
+class BulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    items: List[BulkItemResult]
+
+
 class BlogUpdateRequest(BaseModel):
     title: str
     description: str
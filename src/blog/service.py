@@ -1,35 +1,281 @@
+import uuid
 from datetime import datetime
+from functools import cache
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, and_, bindparam, false, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Bundle, joinedload
 
 from src.auth.models import User
+from src.auth.schemas import UserPrincipal
 from src.blog.models import Blog
-from src.blog.schemas import BlogCreateRequest, BlogUpdateRequest
+from src.blog.schemas import BlogCreateRequest, BlogDetailModel, BlogUpdateRequest
+from src.cache import STALE, TieredCache, cache_backend
+from src.config import Config
+from src.db.main import batched
 from src.errors import BlogAlreadyExists, BlogNotFound
+from src.pagination import (
+    DEFAULT_PAGE_SIZE,
+    build_page,
+    decode_rank_cursor,
+    encode_rank_cursor,
+    keyset_paginate
+)
+from src.serialization import dump_json
+from src.streaming import STREAM_CHUNK_SIZE
+from src.tags.models import BlogTag, Tag
+
+
+blog_detail_cache = TieredCache(
+    'blog',
+    maxsize=Config.BLOG_CACHE_SIZE,
+    ttl=Config.BLOG_CACHE_TTL,
+    backend=cache_backend
+)
+
+AUTHOR_COLUMNS = Bundle(
+    'author', User.first_name, User.last_name, User.username, User.email
+)
+
+
+def blog_rows() -> Select:
+    """Select only what `BlogDetailModel` exposes, joined to the author.
+
+    Results are plain rows (`row.author` is a nested row), so nothing is
+    added to the session's identity map.
+    """
+    return select(
+        Blog.uid,
+        Blog.title,
+        Blog.description,
+        Blog.slug,
+        Blog.publish_date,
+        Blog.datetime_created,
+        Blog.datetime_updated,
+        Blog.review_count,
+        Blog.average_rating.label('average_rating'),
+        AUTHOR_COLUMNS
+    ).join(User, User.uid == Blog.author_uid)
+
+
+# Built once, see user_by_username() in src.auth.service.
+@cache
+def blog_by_slug() -> Select:
+    return (
+        select(Blog)
+        .options(joinedload(Blog.author, innerjoin=True))
+        .where(Blog.slug == bindparam('slug'))
+    )
+
+
+@cache
+def blog_detail_by_slug() -> Select:
+    return blog_rows().where(Blog.slug == bindparam('slug'))
 
 
 class BlogService:
+    async def tag_filter(
+        self, tags: List[str], db: AsyncSession, match_all: bool = True
+    ):
+        """A correlated EXISTS per tag, or one over all of them for `any`.
+
+        Titles are resolved to uids first, so the planner sees each tag's
+        frequency: for a common tag it walks blogs in keyset order and
+        probes blog_tags until LIMIT rows match, for a rare one it starts
+        from that tag's blog_tags entries instead.
+        """
+        result = await db.execute(select(Tag.uid).where(Tag.title.in_(tags)))
+        tag_uids = list(result.scalars())
+
+        if not tag_uids or (match_all and len(tag_uids) < len(tags)):
+            return false()
+
+        if not match_all:
+            return (
+                select(BlogTag.blog_uid)
+                .where(BlogTag.blog_uid == Blog.uid, BlogTag.tag_uid.in_(tag_uids))
+                .exists()
+            )
+
+        return and_(*(
+            select(BlogTag.blog_uid)
+            .where(BlogTag.blog_uid == Blog.uid, BlogTag.tag_uid == tag_uid)
+            .exists()
+            for tag_uid in tag_uids
+        ))
+
     async def get_all_blogs(
-        self, db: AsyncSession
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None
     ):
-        blogs = await db.execute(select(Blog))
-        return blogs.scalars().all()
+        statement = keyset_paginate(blog_rows(), Blog, limit, cursor)
+        blogs = await db.execute(statement)
+        return build_page(blogs.all(), limit)
+
+    async def stream_all_blogs(
+        self,
+        db: AsyncSession,
+        tags: List[str] | None = None,
+        match_all: bool = True
+    ):
+        statement = blog_rows()
+        if tags:
+            statement = statement.where(
+                await self.tag_filter(tags, db, match_all)
+            )
+
+        blogs = await db.stream(
+            statement
+            .order_by(Blog.datetime_created.desc(), Blog.uid.desc())
+            .execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+        async for blog in blogs:
+            yield blog
 
     async def get_blog_by_slug(
         self, slug: str, db: AsyncSession
     ):
-        blog = await db.execute(
-            select(Blog).where(Blog.slug == slug)
-        )
+        blog = await db.execute(blog_by_slug(), {'slug': slug})
         return blog.scalars().first()
 
-    async def get_user_blogs(
-        self, user: User, db: AsyncSession
+    async def get_blog_detail(
+        self, slug: str, db: AsyncSession
+    ):
+        blog = await db.execute(blog_detail_by_slug(), {'slug': slug})
+        return blog.first()
+
+    async def get_blogs_by_tags(
+        self,
+        tags: List[str],
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        match_all: bool = True
+    ):
+        statement = keyset_paginate(
+            blog_rows().where(await self.tag_filter(tags, db, match_all)),
+            Blog, limit, cursor
+        )
+        blogs = await db.execute(statement)
+        return build_page(blogs.all(), limit)
+
+    async def search_blogs(
+        self,
+        q: str,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None
+    ):
+        query = func.websearch_to_tsquery('english', q)
+        rank = func.ts_rank(Blog.search_vector, query)
+
+        matches = (
+            select(
+                Blog.uid,
+                Blog.title,
+                Blog.slug,
+                Blog.publish_date,
+                Blog.description,
+                rank.label('rank')
+            )
+            .where(Blog.search_vector.bool_op('@@')(query))
+        )
+        if cursor:
+            cursor_rank, cursor_uid = decode_rank_cursor(cursor)
+            matches = matches.where(
+                tuple_(rank, Blog.uid) < tuple_(cursor_rank, cursor_uid)
+            )
+        matches = (
+            matches
+            .order_by(rank.desc(), Blog.uid.desc())
+            .limit(limit + 1)
+            .subquery()
+        )
+
+        # Highlighting is done outside the ranked subquery so ts_headline
+        # only runs for the rows on this page.
+        result = await db.execute(
+            select(
+                matches.c.uid,
+                matches.c.title,
+                matches.c.slug,
+                matches.c.publish_date,
+                matches.c.rank,
+                func.ts_headline(
+                    'english',
+                    matches.c.description,
+                    query,
+                    'StartSel=<mark>, StopSel=</mark>, MaxFragments=2'
+                ).label('snippet')
+            )
+            .order_by(matches.c.rank.desc(), matches.c.uid.desc())
+        )
+        rows = result.mappings().all()
+
+        items = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_rank_cursor(items[-1]['rank'], items[-1]['uid'])
+
+        return {'items': items, 'next_cursor': next_cursor}
+
+    async def get_top_rated_blogs(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        min_reviews: int = 1
     ):
         blogs = await db.execute(
-            select(Blog).where(Blog.author_uid == user.uid)
+            blog_rows()
+            .where(Blog.review_count >= min_reviews)
+            .order_by(Blog.average_rating.desc(), Blog.uid.desc())
+            .limit(limit)
+        )
+        return blogs.all()
+
+    async def get_blog_detail_json(
+        self, slug: str, db: AsyncSession
+    ):
+        cached = await blog_detail_cache.get(slug)
+
+        if cached is not None and cached is not STALE:
+            return cached
+
+        blog = await self.get_blog_detail(slug, db)
+
+        if not blog:
+            return None
+
+        content = dump_json(BlogDetailModel, blog)
+
+        if cached is None:
+            await blog_detail_cache.set(slug, content)
+
+        return content
+
+    async def invalidate_blog_detail(self, slug: str) -> None:
+        # Replicas may not have replayed the write yet, so keep them from
+        # refilling the entry until the read-your-writes window has passed.
+        await blog_detail_cache.invalidate(
+            slug, hold=Config.READ_YOUR_WRITES_SECONDS
         )
-        return blogs.scalars().all()
+
+    async def get_user_blogs(
+        self,
+        user: UserPrincipal,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None
+    ):
+        statement = keyset_paginate(
+            blog_rows().where(Blog.author_uid == user.uid),
+            Blog, limit, cursor
+        )
+        blogs = await db.execute(statement)
+        return build_page(blogs.all(), limit)
 
     async def create_blog(
         self, blog_request: BlogCreateRequest, user_uid: str, db: AsyncSession
@@ -50,8 +296,82 @@ class BlogService:
 
         db.add(new_blog)
         await db.commit()
-        await db.refresh(new_blog)
-        return new_blog
+        return await self.get_blog_detail(blog_request.slug, db)
+
+    async def create_blogs(
+        self, blog_requests: List[BlogCreateRequest], user_uid: str, db: AsyncSession
+    ):
+        """Create many blogs with one slug lookup and one multi-row INSERT.
+
+        Both are split into batches only when a statement would pass
+        asyncpg's bind parameter limit. Returns a result per request, in
+        order. A bad item is reported as failed without stopping the rest.
+        """
+        slugs = [blog_request.slug for blog_request in blog_requests]
+        existing = set()
+        for batch in batched(slugs, 1):
+            found = await db.execute(select(Blog.slug).where(Blog.slug.in_(batch)))
+            existing.update(found.scalars())
+
+        now = datetime.now()
+        rows = {}
+        results = []
+
+        for index, blog_request in enumerate(blog_requests):
+            error_code = None
+
+            if blog_request.slug in existing:
+                error_code = 'blog_exists'
+            elif blog_request.slug in rows:
+                error_code = 'duplicate_slug'
+            else:
+                try:
+                    publish_date = datetime.strptime(
+                        blog_request.publish_date, '%Y-%m-%d'
+                    )
+                except ValueError:
+                    error_code = 'invalid_publish_date'
+
+            if error_code:
+                results.append(
+                    {'index': index, 'status': 'failed', 'error_code': error_code}
+                )
+                continue
+
+            uid = uuid.uuid4()
+            rows[blog_request.slug] = {
+                **blog_request.model_dump(),
+                'uid': uid,
+                'publish_date': publish_date,
+                'author_uid': user_uid,
+                'datetime_created': now,
+                'datetime_updated': now,
+            }
+            results.append({'index': index, 'status': 'created', 'uid': uid})
+
+        if rows:
+            inserted = set()
+            for batch in batched(list(rows.values()), len(Blog.__table__.columns)):
+                created = await db.execute(
+                    insert(Blog)
+                    .values(batch)
+                    .on_conflict_do_nothing(index_elements=[Blog.slug])
+                    .returning(Blog.uid)
+                )
+                inserted.update(created.scalars())
+            await db.commit()
+
+            # Another request may have taken a slug since the lookup.
+            for result in results:
+                if result['status'] == 'created' and result['uid'] not in inserted:
+                    result.update(status='failed', uid=None, error_code='blog_exists')
+
+        created = sum(result['status'] == 'created' for result in results)
+        return {
+            'created': created,
+            'failed': len(results) - created,
+            'items': results
+        }
 
     async def update_blog(
             self, slug: str, blog_update_request: BlogUpdateRequest, db: AsyncSession
@@ -68,8 +388,8 @@ class BlogService:
 
         db.add(blog)
         await db.commit()
-        await db.refresh(blog)
-        return blog
+        await self.invalidate_blog_detail(slug)
+        return await self.get_blog_detail(slug, db)
 
     async def delete_blog(
         self, slug: str, db: AsyncSession
@@ -82,6 +402,7 @@ class BlogService:
         if blog is not None:
             await db.delete(blog)
             await db.commit()
+            await self.invalidate_blog_detail(slug)
             return {}
         else:
             return None
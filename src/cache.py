@@ -0,0 +1,332 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from src.config import Config
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+
+# Returned by TieredCache.get while a key is held after an invalidation.
+STALE = object()
+
+# How a held key is stored in the shared backend. Cached values are
+# serialized responses, never empty.
+TOMBSTONE = b''
+
+INVALIDATION_CHANNEL = 'cache:invalidate'
+
+# Backoff between attempts to resubscribe after the pub/sub connection drops.
+LISTENER_RETRY_SECONDS = 0.5
+LISTENER_RETRY_MAX_SECONDS = 30
+
+logger = logging.getLogger('src.cache')
+
+
+class LRUCache:
+    """Size-bounded LRU mapping whose entries may also carry an expiry.
+
+    Expiry times are wall-clock epoch seconds so they can be taken
+    straight from JWT `exp` claims. Expired entries are dropped lazily
+    on lookup; otherwise they age out through normal LRU eviction.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self, key: Hashable, value: Any, expires_at: float | None = None
+    ) -> None:
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self._evict()
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class MemoryBackend:
+    """In-process stand-in for the Redis backend.
+
+    Storage and pub/sub are shared by every TieredCache built on the same
+    instance, which is how several workers behave against one Redis.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+        self._subscribers: list[Callable[[str], None]] = []
+
+    async def get(self, key: str) -> bytes | None:
+        value, expires_at = self._data.get(key, (None, None))
+
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return None
+
+        return value
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None, only_if_absent: bool = False
+    ) -> None:
+        if only_if_absent and await self.get(key) is not None:
+            return
+
+        self._data[key] = (value, time.time() + ttl if ttl else None)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def publish(self, message: str) -> None:
+        for callback in self._subscribers:
+            callback(message)
+
+    def subscribe(
+        self, callback: Callable[[str], None], on_reset: Callable[[], None]
+    ) -> None:
+        # Delivery is synchronous, so no message can be missed.
+        self._subscribers.append(callback)
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisBackend:
+    def __init__(self, url: str) -> None:
+        if redis is None:
+            raise RuntimeError('CACHE_REDIS_URL requires the redis package')
+
+        self._client = redis.from_url(url)
+        self._subscribers: list[Callable[[str], None]] = []
+        self._resets: list[Callable[[], None]] = []
+        self._listener: asyncio.Task | None = None
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(key)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None, only_if_absent: bool = False
+    ) -> None:
+        await self._client.set(
+            key, value, px=int(ttl * 1000) if ttl else None, nx=only_if_absent
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def publish(self, message: str) -> None:
+        await self._client.publish(INVALIDATION_CHANNEL, message)
+
+    def subscribe(
+        self, callback: Callable[[str], None], on_reset: Callable[[], None]
+    ) -> None:
+        """`callback` gets each message, `on_reset` runs when some may be lost."""
+        self._subscribers.append(callback)
+        self._resets.append(on_reset)
+
+    async def start(self) -> None:
+        # The first subscription is made here so startup fails if Redis is down.
+        pubsub = await self._subscribe()
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _subscribe(self):
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+        return pubsub
+
+    async def _listen(self, pubsub) -> None:
+        """Deliver invalidations, resubscribing with backoff if Redis drops."""
+        delay = LISTENER_RETRY_SECONDS
+
+        try:
+            while True:
+                try:
+                    if pubsub is None:
+                        pubsub = await self._subscribe()
+                        delay = LISTENER_RETRY_SECONDS
+
+                        # Invalidations published while disconnected never
+                        # arrived, so nothing held in L1 can be trusted.
+                        for reset in self._resets:
+                            reset()
+                        logger.info('Cache invalidation listener resubscribed')
+
+                    async for message in pubsub.listen():
+                        if message['type'] != 'message':
+                            continue
+
+                        for callback in self._subscribers:
+                            callback(message['data'].decode())
+
+                    raise ConnectionError('pub/sub stream ended')
+                except Exception:
+                    logger.exception(
+                        'Cache invalidation listener failed, retrying in %.1fs', delay
+                    )
+                    await self._discard(pubsub)
+                    pubsub = None
+
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, LISTENER_RETRY_MAX_SECONDS)
+        finally:
+            await self._discard(pubsub)
+
+    @staticmethod
+    async def _discard(pubsub) -> None:
+        if pubsub is not None:
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        await self._client.aclose()
+
+
+class TieredCache:
+    """Per-process LRUCache (L1) in front of an optional shared backend (L2).
+
+    Values are bytes. `invalidate` removes a key from L2 and publishes it,
+    so every process drops its L1 copy. With `hold`, the key is instead
+    kept as a tombstone for that many seconds and fills are refused, which
+    stops a lagging replica from putting the old value straight back.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        maxsize: int,
+        ttl: float | None = None,
+        backend: MemoryBackend | RedisBackend | None = None
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self._l1 = LRUCache(maxsize, ttl)
+        self._backend = backend
+
+        if backend is not None:
+            backend.subscribe(self._on_invalidate, self.clear)
+
+    def _shared_key(self, key: str) -> str:
+        return f'{self.namespace}:{key}'
+
+    async def get(self, key: str) -> Any:
+        value = self._l1.get(key)
+
+        if value is not None or self._backend is None:
+            return value
+
+        value = await self._backend.get(self._shared_key(key))
+
+        if value == TOMBSTONE:
+            return STALE
+        if value is not None:
+            self._l1.set(key, value)
+
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        if self._l1.get(key) is STALE:
+            return
+
+        self._l1.set(key, value)
+
+        if self._backend is not None:
+            await self._backend.set(
+                self._shared_key(key), value, self.ttl, only_if_absent=True
+            )
+
+    async def invalidate(self, key: str, hold: float = 0) -> None:
+        self._drop(key, hold)
+
+        if self._backend is None:
+            return
+
+        if hold:
+            await self._backend.set(self._shared_key(key), TOMBSTONE, hold)
+        else:
+            await self._backend.delete(self._shared_key(key))
+
+        await self._backend.publish(json.dumps([self.namespace, key, hold]))
+
+    def _drop(self, key: str, hold: float) -> None:
+        if hold:
+            self._l1.set(key, STALE, expires_at=time.time() + hold)
+        else:
+            self._l1.delete(key)
+
+    def _on_invalidate(self, message: str) -> None:
+        namespace, key, hold = json.loads(message)
+
+        if namespace == self.namespace:
+            self._drop(key, hold)
+
+    def clear(self) -> None:
+        self._l1.clear()
+
+    def stats(self) -> dict:
+        return {**self._l1.stats(), 'shared': self._backend is not None}
+
+
+# Without CACHE_REDIS_URL every TieredCache is L1 only: a per-process
+# MemoryBackend would hold a second copy of each value and reach no other
+# worker, so it is only used in tests.
+cache_backend = (
+    RedisBackend(Config.CACHE_REDIS_URL) if Config.CACHE_REDIS_URL else None
+)
@@ -1,13 +1,46 @@
+from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_ECHO: bool
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500
+    DATABASE_QUERY_CACHE_SIZE: int = 1000
+    DATABASE_WARM_CONNECTIONS: int = 2
+    DATABASE_REPLICA_URLS: List[str] = []
+    DATABASE_REPLICA_STRATEGY: str = 'round_robin'
+    READ_YOUR_WRITES_SECONDS: int = 5
     JWT_SECRET: str
     JWT_ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DATES: int
+    PASSWORD_HASHER_EXECUTOR: str = 'thread'
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_QUEUE: int = 64
+    TOKEN_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: int = 60
+    BLOG_CACHE_SIZE: int = 5000
+    BLOG_CACHE_TTL: int = 300
+    TAG_CACHE_SIZE: int = 5000
+    TAG_CACHE_TTL: int = 300
+    CACHE_REDIS_URL: str | None = None
+    SQL_INSTRUMENTATION: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    BULK_CREATE_MAX_ITEMS: int = 1000
+    LOGIN_USERNAME_BURST: int = 5
+    LOGIN_USERNAME_PER_MINUTE: float = 5
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 30
+    LOGIN_THROTTLE_CACHE_SIZE: int = 100000
+    LOGIN_THROTTLE_REDIS_URL: str | None = None
+    REVOCATION_REFRESH_SECONDS: float = 5
 
     model_config = SettingsConfigDict(
         env_file='.env',
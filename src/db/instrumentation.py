@@ -0,0 +1,73 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+PLACEHOLDER_LIST = re.compile(r'\$\d+(?:\s*,\s*\$\d+)*')
+
+
+class RequestQueries:
+    def __init__(self) -> None:
+        self.statements = 0
+        self.duration_ms = 0.0
+        self.rows = 0
+        self.shapes = Counter()
+
+    def record(self, statement: str, duration_ms: float, rows: int) -> None:
+        self.statements += 1
+        self.duration_ms += duration_ms
+        self.rows += max(rows, 0)
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes run more than `threshold` times, i.e. likely N+1."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.duration_ms:.2f};desc="{self.statements} queries", '
+            f'db-rows;desc="{self.rows}"'
+        )
+
+
+current_queries: ContextVar[RequestQueries | None] = ContextVar(
+    'current_queries', default=None
+)
+
+
+def statement_shape(statement: str) -> str:
+    """Collapse expanded IN lists so `IN ($1, $2)` and `IN ($1)` match."""
+    return PLACEHOLDER_LIST.sub('?', ' '.join(statement.split()))
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attribute every statement on `engine` to the current request.
+
+    Statements run outside a request (no `RequestQueries` in context)
+    are ignored.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if current_queries.get() is not None:
+            conn.info.setdefault('query_started_at', []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries = current_queries.get()
+        started = conn.info.get('query_started_at')
+
+        if queries is None or not started:
+            return
+
+        duration_ms = (time.perf_counter() - started.pop()) * 1000
+        rows = cursor.rowcount if cursor.description is not None else 0
+        queries.record(statement, duration_ms, rows)
@@ -1,7 +1,11 @@
 import contextlib
-from typing import Any, AsyncIterator
+import itertools
+import time
+from typing import Any, AsyncIterator, Iterator, List
+from fastapi import Request
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine
@@ -9,21 +13,126 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import declarative_base
 
 from src.config import Config
+from src.db.pool import InstrumentedPool, PoolStats
+
+
+READ_YOUR_WRITES_COOKIE = 'primary_until'
+
+# asyncpg refuses statements with more bind parameters than this.
+MAX_BIND_PARAMETERS = 32767
+
+
+def batched(items: list, parameters_per_item: int) -> Iterator[list]:
+    """Split `items` so no statement built from a slice exceeds the limit."""
+    size = max(1, MAX_BIND_PARAMETERS // parameters_per_item)
+
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _engine_pool_status(engine: AsyncEngine, stats: PoolStats) -> dict:
+    pool = engine.pool
+    status = {'pool': pool.status(), **stats.as_dict()}
+
+    if isinstance(pool, InstrumentedPool):
+        capacity = pool.size() + pool._max_overflow
+        status.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            'saturation': pool.checkedout() / capacity if capacity > 0 else 1.0,
+        })
+
+    return status
 
 
 class DatabaseSessionManager:
-    def __init__(self, host: str, engine_kwargs: dict[str, Any] = {}) -> None:
-        self._engine = create_async_engine(host, **engine_kwargs)
+    def __init__(
+        self,
+        host: str,
+        engine_kwargs: dict[str, Any] = {},
+        replica_hosts: List[str] = [],
+        replica_strategy: str = 'round_robin'
+    ) -> None:
+        self._host = host
+        self._engine_kwargs = engine_kwargs
+        self._replica_hosts = replica_hosts
+        self._replica_strategy = replica_strategy
+        self._replica_counter = itertools.count()
+
+        self._engine = None
+        self._sessionmaker = None
+        self._replica_engines = []
+        self._replica_sessionmakers = []
+
+    def init(self) -> None:
+        """Create the engines. Called from the app's lifespan on startup."""
+        if self._engine is not None:
+            return
+
+        self._engine = create_async_engine(self._host, **self._engine_kwargs)
         self._sessionmaker = async_sessionmaker(autocommit=False, bind=self._engine)
+        self.pool_stats = PoolStats()
+        self.pool_stats.attach(self._engine)
+
+        self._replica_engines = [
+            create_async_engine(replica_host, **self._engine_kwargs)
+            for replica_host in self._replica_hosts
+        ]
+        self._replica_sessionmakers = [
+            async_sessionmaker(autocommit=False, bind=engine)
+            for engine in self._replica_engines
+        ]
+        self.replica_pool_stats = [PoolStats() for _ in self._replica_engines]
+        for stats, engine in zip(self.replica_pool_stats, self._replica_engines):
+            stats.attach(engine)
+
+    @property
+    def engines(self) -> List[AsyncEngine]:
+        if self._engine is None:
+            raise Exception('DatabaseSessionManager is not initilized')
+
+        return [self._engine, *self._replica_engines]
 
     async def close(self):
         if self._engine is None:
             raise Exception('DatabaseSessionManager is not initilized')
         await self._engine.dispose()
 
+        for engine in self._replica_engines:
+            await engine.dispose()
+
         self._engine = None
         self._sessionmaker = None
+        self._replica_engines = []
+        self._replica_sessionmakers = []
     
+    def pool_status(self) -> dict:
+        if self._engine is None:
+            raise Exception('DatabaseSessionManager is not initilized')
+
+        status = _engine_pool_status(self._engine, self.pool_stats)
+        status['replicas'] = [
+            _engine_pool_status(engine, stats)
+            for engine, stats in zip(self._replica_engines, self.replica_pool_stats)
+        ]
+        return status
+
+    def _choose_replica(self) -> async_sessionmaker | None:
+        if not self._replica_sessionmakers:
+            return None
+
+        if self._replica_strategy == 'least_busy':
+            index = min(
+                range(len(self._replica_engines)),
+                key=lambda i: self._replica_engines[i].pool.checkedout()
+            )
+        else:
+            index = next(self._replica_counter) % len(self._replica_sessionmakers)
+
+        return self._replica_sessionmakers[index]
+
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
         if self._engine is None:
@@ -37,11 +146,15 @@ class DatabaseSessionManager:
                 raise
     
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncConnection]:
+    async def session(self, read_only: bool = False) -> AsyncIterator[AsyncSession]:
         if self._sessionmaker is None:
             raise Exception('DatabaseSessionManager is not initilized')
 
-        session = self._sessionmaker()
+        sessionmaker = self._sessionmaker
+        if read_only:
+            sessionmaker = self._choose_replica() or self._sessionmaker
+
+        session = sessionmaker()
 
         try:
             yield session
@@ -54,7 +167,25 @@ class DatabaseSessionManager:
 
 sessionmanager = DatabaseSessionManager(
     Config.DATABASE_URL,
-    {'echo': Config.DATABASE_ECHO}
+    {
+        'echo': Config.DATABASE_ECHO,
+        # Expanding IN lists and multi-row inserts render new SQL for every
+        # list length, so both caches are sized well above the app's fixed
+        # statements to keep the hot lookups compiled and prepared once per
+        # connection.
+        'query_cache_size': Config.DATABASE_QUERY_CACHE_SIZE,
+        'poolclass': InstrumentedPool,
+        'pool_size': Config.DATABASE_POOL_SIZE,
+        'max_overflow': Config.DATABASE_MAX_OVERFLOW,
+        'pool_timeout': Config.DATABASE_POOL_TIMEOUT,
+        'pool_recycle': Config.DATABASE_POOL_RECYCLE,
+        'pool_pre_ping': Config.DATABASE_POOL_PRE_PING,
+        'connect_args': {
+            'prepared_statement_cache_size': Config.DATABASE_STATEMENT_CACHE_SIZE
+        },
+    },
+    Config.DATABASE_REPLICA_URLS,
+    Config.DATABASE_REPLICA_STRATEGY
 )
 
 
@@ -63,4 +194,26 @@ async def get_session():
         yield session
 
 
+def reads_own_writes(request: Request) -> bool:
+    primary_until = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+
+    try:
+        return primary_until is not None and float(primary_until) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(request: Request):
+    """Session bound to a replica, unless this client wrote recently.
+
+    Clients that made a write within READ_YOUR_WRITES_SECONDS carry a
+    `primary_until` cookie and keep reading from the primary so they see
+    their own changes before the replicas catch up.
+    """
+    read_only = not reads_own_writes(request)
+
+    async with sessionmanager.session(read_only=read_only) as session:
+        yield session
+
+
 Base = declarative_base()
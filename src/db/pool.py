@@ -0,0 +1,108 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+LIFETIME_BUCKETS_S = (1, 10, 60, 300, 900, 1800, 3600, 14400)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def as_dict(self) -> dict:
+        labels = [f'le_{bound}' for bound in self.buckets] + ['inf']
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self.checkout_wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.connection_lifetime_s = Histogram(LIFETIME_BUCKETS_S)
+        self.timeouts = 0
+        self.connects = 0
+        self.closes = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Record connection lifetimes from the engine's pool events.
+
+        Listening on the engine rather than the pool keeps the hooks in
+        place when the pool is recreated by `dispose()`.
+        """
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, 'connect')
+        def on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+            connection_record.info['connected_at'] = time.monotonic()
+
+        @event.listens_for(sync_engine, 'close')
+        def on_close(dbapi_connection, connection_record):
+            self.closes += 1
+            connected_at = connection_record.info.pop('connected_at', None)
+
+            if connected_at is not None:
+                self.connection_lifetime_s.observe(
+                    time.monotonic() - connected_at
+                )
+
+        if isinstance(sync_engine.pool, InstrumentedPool):
+            sync_engine.pool.stats = self
+
+    def as_dict(self) -> dict:
+        return {
+            'checkout_wait_ms': self.checkout_wait_ms.as_dict(),
+            'connection_lifetime_s': self.connection_lifetime_s.as_dict(),
+            'timeouts': self.timeouts,
+            'connects': self.connects,
+            'closes': self.closes,
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that times how long each checkout waits for a slot."""
+
+    stats: PoolStats | None = None
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            if self.stats is not None:
+                self.stats.timeouts += 1
+            raise
+        finally:
+            if self.stats is not None:
+                self.stats.checkout_wait_ms.observe(
+                    (time.perf_counter() - started_at) * 1000
+                )
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, status
+
+from src.auth.dependencies import RoleChecker, token_cache
+from src.auth.hashing import password_hasher
+from src.db.main import sessionmanager
+
+
+db_router = APIRouter()
+
+
+@db_router.get(
+    '/pool',
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(RoleChecker(['admin']))]
+)
+async def get_pool_status():
+    return sessionmanager.pool_status()
+
+
+@db_router.get(
+    '/stats',
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(RoleChecker(['admin']))]
+)
+async def get_stats():
+    return {
+        'token_cache': token_cache.stats(),
+        'password_hasher': password_hasher.stats(),
+    }
@@ -69,6 +69,22 @@ class TagAlreadyExists(BlogException):
     pass
 
 
+class InvalidCursor(BlogException):
+    pass
+
+
+class PasswordHasherBusy(BlogException):
+    pass
+
+
+class InsufficientPermission(BlogException):
+    pass
+
+
+class TooManyLoginAttempts(BlogException):
+    pass
+
+
 def create_exception_handler(
     status_code: int, initial_detail: Any
 ) -> Callable[[Request, Exception], JSONResponse]:
@@ -238,6 +254,47 @@ def register_all_errors(app: FastAPI):
             },
         ),
     )
+    app.add_exception_handler(
+        InvalidCursor,
+        create_exception_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            initial_detail={
+                'message': 'Pagination cursor is invalid',
+                'resolution': 'Use the next_cursor value from a previous page',
+                'error_code': 'invalid_cursor'
+            },
+        ),
+    )
+    app.add_exception_handler(
+        PasswordHasherBusy,
+        create_exception_handler(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            initial_detail={
+                'message': 'Server is busy, please try again shortly',
+                'error_code': 'server_busy'
+            },
+        ),
+    )
+    app.add_exception_handler(
+        InsufficientPermission,
+        create_exception_handler(
+            status_code=status.HTTP_403_FORBIDDEN,
+            initial_detail={
+                'message': 'You do not have enough permissions to perform this action',
+                'error_code': 'insufficient_permissions'
+            },
+        ),
+    )
+    app.add_exception_handler(
+        TooManyLoginAttempts,
+        create_exception_handler(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            initial_detail={
+                'message': 'Too many login attempts, please try again later',
+                'error_code': 'too_many_login_attempts'
+            },
+        ),
+    )
     @app.exception_handler(500)
     async def internal_server_error(request, exc):
 
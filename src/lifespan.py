@@ -0,0 +1,114 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+from src.auth.hashing import password_hasher
+from src.auth.revocation import revocation_list
+from src.auth.service import user_by_username
+from src.blog.service import blog_by_slug, blog_detail_by_slug
+from src.cache import cache_backend
+from src.config import Config
+from src.db.instrumentation import instrument_engine
+from src.db.main import sessionmanager
+from src.reviews.service import review_by_uid, review_detail_by_uid
+from src.tags.service import tag_by_uid
+
+
+logger = logging.getLogger('src.lifespan')
+
+NO_UID = str(uuid.UUID(int=0))
+
+# Run once per warm connection with parameters that match nothing, so
+# each is compiled once and prepared by asyncpg before real traffic.
+HOT_STATEMENTS = (
+    (user_by_username, {'username': ''}),
+    (blog_by_slug, {'slug': ''}),
+    (blog_detail_by_slug, {'slug': ''}),
+    (review_by_uid, {'uid': NO_UID}),
+    (review_detail_by_uid, {'uid': NO_UID}),
+    (tag_by_uid, {'uid': NO_UID}),
+)
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open `connections` pooled connections at once and prepare on each."""
+    async with contextlib.AsyncExitStack() as stack:
+        opened = await asyncio.gather(*(
+            stack.enter_async_context(engine.connect())
+            for _ in range(connections)
+        ))
+
+        for conn in opened:
+            await conn.execute(text('SELECT 1'))
+            async with AsyncSession(bind=conn) as db:
+                for statement, parameters in HOT_STATEMENTS:
+                    await db.execute(statement(), parameters)
+            await conn.rollback()
+
+
+async def refresh_revocations() -> None:
+    while True:
+        await asyncio.sleep(Config.REVOCATION_REFRESH_SECONDS)
+
+        try:
+            async with sessionmanager.session() as db:
+                await revocation_list.refresh(db)
+                await revocation_list.delete_expired(db)
+        except Exception:
+            logger.exception('Refreshing revoked tokens failed')
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    started_at = time.perf_counter()
+
+    configure_mappers()
+    sessionmanager.init()
+    password_hasher.init()
+
+    if Config.SQL_INSTRUMENTATION:
+        for engine in sessionmanager.engines:
+            instrument_engine(engine)
+
+    connections = min(Config.DATABASE_WARM_CONNECTIONS, Config.DATABASE_POOL_SIZE)
+    if connections > 0:
+        await asyncio.gather(*(
+            warm_up(engine, connections) for engine in sessionmanager.engines
+        ))
+
+    if cache_backend is not None:
+        await cache_backend.start()
+
+    async with sessionmanager.session() as db:
+        await revocation_list.refresh(db)
+    revocation_task = asyncio.create_task(refresh_revocations())
+
+    app.state.startup_seconds = time.perf_counter() - started_at
+    logger.info(json.dumps({
+        'event': 'startup',
+        'startup_ms': round(app.state.startup_seconds * 1000, 2),
+        'warm_connections': connections,
+        'engines': len(sessionmanager.engines),
+        'revoked_tokens': len(revocation_list),
+    }))
+
+    try:
+        yield
+    finally:
+        # The server only gets here after in-flight requests have finished.
+        revocation_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await revocation_task
+
+        await sessionmanager.close()
+        if cache_backend is not None:
+            await cache_backend.close()
+        password_hasher.close()
+        logger.info(json.dumps({'event': 'shutdown'}))
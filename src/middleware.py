@@ -0,0 +1,66 @@
+import json
+import logging
+import time
+from fastapi import FastAPI, Request
+
+from src.config import Config
+from src.db.instrumentation import RequestQueries, current_queries
+from src.db.main import READ_YOUR_WRITES_COOKIE
+
+
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+sql_logger = logging.getLogger('src.sql')
+
+
+def register_middleware(app: FastAPI):
+
+    @app.middleware('http')
+    async def read_your_writes(request: Request, call_next):
+        response = await call_next(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                str(time.time() + Config.READ_YOUR_WRITES_SECONDS),
+                max_age=Config.READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                samesite='lax'
+            )
+
+        return response
+
+    # Engines are instrumented in src.lifespan once they exist.
+    if not Config.SQL_INSTRUMENTATION:
+        return
+
+    @app.middleware('http')
+    async def sql_instrumentation(request: Request, call_next):
+        queries = RequestQueries()
+        token = current_queries.set(queries)
+
+        try:
+            response = await call_next(request)
+        finally:
+            current_queries.reset(token)
+
+        response.headers['Server-Timing'] = queries.server_timing()
+
+        repeated = queries.repeated(Config.SQL_N_PLUS_ONE_THRESHOLD)
+        sql_logger.log(
+            logging.WARNING if repeated else logging.INFO,
+            json.dumps({
+                'method': request.method,
+                'path': request.url.path,
+                'status': response.status_code,
+                'statements': queries.statements,
+                'db_ms': round(queries.duration_ms, 2),
+                'rows': queries.rows,
+                'n_plus_one': [
+                    {'statement': shape, 'count': count}
+                    for shape, count in repeated
+                ],
+            })
+        )
+
+        return response
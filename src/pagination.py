@@ -0,0 +1,84 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Generic, List, Sequence, TypeVar
+from pydantic import BaseModel
+from sqlalchemy import Select, tuple_
+
+from src.errors import InvalidCursor
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+T = TypeVar('T')
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: str | None = None
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(datetime_created: datetime, uid: uuid.UUID) -> str:
+    return _encode([datetime_created.isoformat(), str(uid)])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        created, uid = _decode(cursor)
+        return datetime.fromisoformat(created), uuid.UUID(uid)
+    except (ValueError, TypeError):
+        raise InvalidCursor()
+
+
+def encode_rank_cursor(rank: float, uid: uuid.UUID) -> str:
+    return _encode([rank, str(uid)])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        rank, uid = _decode(cursor)
+        return float(rank), uuid.UUID(uid)
+    except (ValueError, TypeError):
+        raise InvalidCursor()
+
+
+def keyset_paginate(
+    statement: Select, model, limit: int, cursor: str | None = None
+) -> Select:
+    """Order newest first on (datetime_created, uid) and seek past the cursor.
+
+    One extra row is fetched so `build_page` can tell whether another
+    page exists without a separate count query.
+    """
+    if cursor:
+        created, uid = decode_cursor(cursor)
+        statement = statement.where(
+            tuple_(model.datetime_created, model.uid) < tuple_(created, uid)
+        )
+
+    return statement.order_by(
+        model.datetime_created.desc(), model.uid.desc()
+    ).limit(limit + 1)
+
+
+def build_page(rows: Sequence, limit: int) -> dict:
+    items = list(rows[:limit])
+    next_cursor = None
+
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.datetime_created, last.uid)
+
+    return {'items': items, 'next_cursor': next_cursor}
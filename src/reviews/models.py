@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Integer, ForeignKey, CheckConstraint, Index
 import sqlalchemy.dialects.postgresql as pg
 from sqlalchemy.orm import relationship
 
@@ -20,21 +20,26 @@ class Review(Base):
     body = Column(String, nullable=False)
     rating = Column(Integer, nullable=True, default=1)
     datetime_created = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
     datetime_updated = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
 
-    author_uid = Column(pg.UUID, ForeignKey('users.uid'), nullable=False)
-    blog_uid = Column(pg.UUID, ForeignKey('blogs.uid'), nullable=False)
+    author_uid = Column(
+        pg.UUID, ForeignKey('users.uid'), nullable=False, index=True
+    )
+    blog_uid = Column(
+        pg.UUID, ForeignKey('blogs.uid'), nullable=False, index=True
+    )
 
-    author = relationship(User, back_populates='reviews', lazy='selectin')
-    blog = relationship(Blog, back_populates='reviews', lazy='selectin')
+    author = relationship(User, back_populates='reviews')
+    blog = relationship(Blog, back_populates='reviews')
 
     __table_args__ = (
         CheckConstraint('rating >= 1', name='check_rating_min'),
         CheckConstraint('rating <= 5', name='check_rating_max'),
+        Index('ix_reviews_datetime_created_uid', 'datetime_created', 'uid'),
     )
 
     def __repr__(self):
@@ -1,33 +1,53 @@
-from fastapi import APIRouter, status, HTTPException, Depends
-from typing import Annotated, List
+from fastapi import APIRouter, status, HTTPException, Depends, Query, Request
+from typing import Annotated
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.dependencies import get_current_user
-from src.auth.models import User
-from src.db.main import get_session
+from src.auth.dependencies import get_current_principal
+from src.auth.schemas import UserPrincipal
+from src.blog.schemas import BulkCreateResponse
+from src.db.main import get_read_session, get_session, reads_own_writes
 from src.errors import ReviewNotFound
-from src.reviews.schemas import ReviewCreateRequest, ReviewDetailModel, ReviewShowModel
+from src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from src.reviews.schemas import (
+    ReviewBulkCreateRequest,
+    ReviewCreateRequest,
+    ReviewDetailModel,
+    ReviewShowModel
+)
 from src.reviews.service import ReviewService
+from src.serialization import model_response
+from src.streaming import ndjson_response, wants_ndjson
 
 
 review_router = APIRouter()
 
 db_dependency = Annotated[AsyncSession, Depends(get_session)]
-user_dependency = Annotated[User, Depends(get_current_user)]
+read_db_dependency = Annotated[AsyncSession, Depends(get_read_session)]
+user_dependency = Annotated[UserPrincipal, Depends(get_current_principal)]
 review_service = ReviewService()
 
 
 @review_router.get(
     '/',
     status_code=status.HTTP_200_OK,
-    response_model=List[ReviewDetailModel]
+    response_model=Page[ReviewDetailModel]
 )
 async def get_all_reviews(
-    db: db_dependency
+    request: Request,
+    db: read_db_dependency,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
 ):
-    reviews = await review_service.get_all_reviews(db)
-    return reviews
+    if wants_ndjson(request):
+        return ndjson_response(
+            review_service.stream_all_reviews,
+            ReviewDetailModel,
+            read_only=not reads_own_writes(request)
+        )
+
+    reviews = await review_service.get_all_reviews(db, limit, cursor)
+    return model_response(Page[ReviewDetailModel], reviews)
 
 
 @review_router.get(
@@ -37,14 +57,14 @@ async def get_all_reviews(
 )
 async def get_review(
     review_uid: str,
-    db: db_dependency
+    db: read_db_dependency
 ):
-    review = await review_service.get_review_by_uid(review_uid, db)
+    review = await review_service.get_review_detail(review_uid, db)
 
     if not review:
         raise ReviewNotFound()
 
-    return review
+    return model_response(ReviewDetailModel, review)
 
 
 @review_router.post(
@@ -61,7 +81,25 @@ async def create_review_for_blog(
     new_review = await review_service.add_review_to_blog(
         review_request, blog_slug, user, db
     )
-    return new_review
+    return model_response(
+        ReviewShowModel, new_review, status.HTTP_201_CREATED
+    )
+
+
+@review_router.post(
+    '/bulk',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkCreateResponse
+)
+async def create_reviews(
+    bulk_request: ReviewBulkCreateRequest,
+    user: user_dependency,
+    db: db_dependency
+):
+    results = await review_service.add_reviews(
+        bulk_request.reviews, user, db
+    )
+    return model_response(BulkCreateResponse, results)
 
 
 @review_router.delete(
@@ -1,9 +1,11 @@
 from datetime import datetime
 import uuid
+from typing import List
 from pydantic import BaseModel, Field
 
 from src.auth.schemas import UserShowModel
 from src.blog.schemas import BlogShowModel
+from src.config import Config
 
 
 class ReviewShowModel(BaseModel):
@@ -21,3 +23,13 @@ class ReviewDetailModel(ReviewShowModel):
 class ReviewCreateRequest(BaseModel):
     body: str
     rating: int = Field(gt=0, le=5)
+
+
+class ReviewBulkItem(ReviewCreateRequest):
+    blog_slug: str
+
+
+class ReviewBulkCreateRequest(BaseModel):
+    reviews: List[ReviewBulkItem] = Field(
+        min_length=1, max_length=Config.BULK_CREATE_MAX_ITEMS
+    )
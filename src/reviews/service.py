@@ -1,45 +1,115 @@
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from functools import cache
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, Select, bindparam, column, delete, select, update, values
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.orm import Bundle, joinedload
 from fastapi import HTTPException, status
 
 from src.auth.models import User
-from src.errors import BlogNotFound, UserNotFound
+from src.auth.schemas import UserPrincipal
+from src.blog.models import Blog
+from src.db.main import batched
+from src.errors import BlogNotFound
+from src.pagination import DEFAULT_PAGE_SIZE, build_page, keyset_paginate
 from src.reviews.models import Review
-from src.auth.service import UserService
-from src.blog.service import BlogService
-from src.reviews.schemas import ReviewCreateRequest
+from src.streaming import STREAM_CHUNK_SIZE
+from src.blog.service import AUTHOR_COLUMNS, BlogService
+from src.reviews.schemas import ReviewBulkItem, ReviewCreateRequest
 
 
-user_service = UserService()
 blog_service = BlogService()
 
+BLOG_COLUMNS = Bundle(
+    'blog',
+    Blog.title,
+    Blog.description,
+    Blog.slug,
+    Blog.publish_date,
+    Blog.datetime_created,
+    Blog.datetime_updated
+)
+
+
+def review_rows() -> Select:
+    """Select only what `ReviewDetailModel` exposes, as plain rows."""
+    return (
+        select(
+            Review.uid,
+            Review.body,
+            Review.rating,
+            Review.datetime_created,
+            AUTHOR_COLUMNS,
+            BLOG_COLUMNS
+        )
+        .join(User, User.uid == Review.author_uid)
+        .join(Blog, Blog.uid == Review.blog_uid)
+    )
+
+
+# Built once, see user_by_username() in src.auth.service.
+@cache
+def review_by_uid() -> Select:
+    return (
+        select(Review)
+        .options(
+            joinedload(Review.author, innerjoin=True),
+            joinedload(Review.blog, innerjoin=True)
+        )
+        .where(Review.uid == bindparam('uid'))
+    )
+
+
+@cache
+def review_detail_by_uid() -> Select:
+    return review_rows().where(Review.uid == bindparam('uid'))
+
 
 class ReviewService:
     async def get_all_reviews(
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None
+    ):
+        statement = keyset_paginate(review_rows(), Review, limit, cursor)
+        reviews = await db.execute(statement)
+        return build_page(reviews.all(), limit)
+
+    async def stream_all_reviews(
         self, db: AsyncSession
     ):
-        reviews = await db.execute(select(Review))
-        return reviews.scalars().all()
+        reviews = await db.stream(
+            review_rows()
+            .order_by(Review.datetime_created.desc(), Review.uid.desc())
+            .execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+        async for review in reviews:
+            yield review
 
     async def get_review_by_uid(
         self, review_uid: str, db: AsyncSession
     ):
-        review = await db.execute(select(Review).where(Review.uid == review_uid))
+        review = await db.execute(review_by_uid(), {'uid': review_uid})
         return review.scalars().first()
 
+    async def get_review_detail(
+        self, review_uid: str, db: AsyncSession
+    ):
+        review = await db.execute(review_detail_by_uid(), {'uid': review_uid})
+        return review.first()
+
     async def add_review_to_blog(
         self,
         review_request: ReviewCreateRequest,
         blog_slug: str,
-        user: User,
+        user: UserPrincipal,
         db: AsyncSession
     ):
-        username = user.username
         blog = await blog_service.get_blog_by_slug(blog_slug, db)
-        user = await user_service.get_user_by_username(username, db)
-
-        if not user:
-            raise UserNotFound()
 
         if not blog:
             raise BlogNotFound()
@@ -50,20 +120,142 @@ class ReviewService:
             blog_uid=blog.uid
         )
         db.add(new_reviewe)
+        await db.execute(
+            update(Blog)
+            .where(Blog.uid == blog.uid)
+            .values(
+                review_count=Blog.review_count + 1,
+                rating_sum=Blog.rating_sum + (new_reviewe.rating or 0)
+            )
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
+        await blog_service.invalidate_blog_detail(blog_slug)
         await db.refresh(new_reviewe)
         return new_reviewe
 
+    async def add_reviews(
+        self,
+        review_requests: List[ReviewBulkItem],
+        user: UserPrincipal,
+        db: AsyncSession
+    ):
+        """Add reviews to any number of blogs in a fixed number of statements.
+
+        Blogs are resolved with one IN query, the reviews go in with one
+        multi-row INSERT and every touched blog's aggregates are moved by a
+        single UPDATE ... FROM (VALUES ...). Each is split into batches only
+        when it would pass asyncpg's bind parameter limit.
+        """
+        slugs = list({review_request.blog_slug for review_request in review_requests})
+        blog_uids = {}
+        for batch in batched(slugs, 1):
+            blogs = await db.execute(
+                select(Blog.slug, Blog.uid).where(Blog.slug.in_(batch))
+            )
+            blog_uids.update(blogs.all())
+
+        now = datetime.now()
+        rows = []
+        results = []
+        totals = defaultdict(lambda: [0, 0])
+
+        for index, review_request in enumerate(review_requests):
+            blog_uid = blog_uids.get(review_request.blog_slug)
+
+            if blog_uid is None:
+                results.append(
+                    {'index': index, 'status': 'failed', 'error_code': 'blog_not_found'}
+                )
+                continue
+
+            uid = uuid.uuid4()
+            rows.append({
+                'uid': uid,
+                'body': review_request.body,
+                'rating': review_request.rating,
+                'author_uid': user.uid,
+                'blog_uid': blog_uid,
+                'datetime_created': now,
+                'datetime_updated': now,
+            })
+            totals[blog_uid][0] += 1
+            totals[blog_uid][1] += review_request.rating
+            results.append({'index': index, 'status': 'created', 'uid': uid})
+
+        if rows:
+            for batch in batched(rows, len(Review.__table__.columns)):
+                await db.execute(insert(Review).values(batch))
+
+            blog_totals = [
+                (blog_uid, count, rating_sum)
+                for blog_uid, (count, rating_sum) in totals.items()
+            ]
+            for batch in batched(blog_totals, 3):
+                deltas = values(
+                    column('blog_uid', UUID),
+                    column('review_count', Integer),
+                    column('rating_sum', Integer),
+                    name='deltas'
+                ).data(batch)
+
+                await db.execute(
+                    update(Blog)
+                    .where(Blog.uid == deltas.c.blog_uid)
+                    .values(
+                        review_count=Blog.review_count + deltas.c.review_count,
+                        rating_sum=Blog.rating_sum + deltas.c.rating_sum
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+
+            for slug, blog_uid in blog_uids.items():
+                if blog_uid in totals:
+                    await blog_service.invalidate_blog_detail(slug)
+
+        created = len(rows)
+        return {
+            'created': created,
+            'failed': len(results) - created,
+            'items': results
+        }
+
     async def delete_review(
-        self, review_uid: str, user: User, db: AsyncSession
+        self, review_uid: str, user: UserPrincipal, db: AsyncSession
     ):
         review = await self.get_review_by_uid(review_uid, db)
 
-        if not review or (review.author != user):
+        if not review or (review.author_uid != user.uid):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail='Cannot delete this review'
             )
 
-        await db.delete(review)
+        blog_slug = review.blog.slug
+
+        # Only the request whose DELETE removed the row adjusts the blog,
+        # so overlapping deletes cannot count the same review twice.
+        deleted = await db.execute(
+            delete(Review)
+            .where(Review.uid == review_uid, Review.author_uid == user.uid)
+            .returning(Review.blog_uid, Review.rating)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = deleted.first()
+
+        if deleted is None:
+            await db.rollback()
+            return
+
+        await db.execute(
+            update(Blog)
+            .where(Blog.uid == deleted.blog_uid)
+            .values(
+                review_count=Blog.review_count - 1,
+                rating_sum=Blog.rating_sum - (deleted.rating or 0)
+            )
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
+        await blog_service.invalidate_blog_detail(blog_slug)
@@ -0,0 +1,41 @@
+import orjson
+from functools import lru_cache
+from typing import Any
+from fastapi import status
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def dump_json(response_type: Any, data: Any) -> bytes:
+    """Validate ORM objects or row mappings and encode them in one pass.
+
+    Both steps run inside pydantic-core with the adapter built once per
+    type, instead of FastAPI's validate, dump to dicts, `jsonable_encoder`
+    and `json.dumps` sequence.
+    """
+    adapter = type_adapter(response_type)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def model_response(
+    response_type: Any,
+    data: Any,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    return Response(
+        content=dump_json(response_type, data),
+        status_code=status_code,
+        media_type='application/json'
+    )
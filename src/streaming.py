@@ -0,0 +1,40 @@
+from typing import Any, AsyncIterator, Callable
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.main import sessionmanager
+from src.serialization import type_adapter
+
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+STREAM_CHUNK_SIZE = 500
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get('accept', '')
+
+
+def ndjson_response(
+    rows: Callable[[AsyncSession], AsyncIterator[Any]],
+    model: type[BaseModel],
+    read_only: bool
+) -> StreamingResponse:
+    """Serialize rows one per line as they arrive from the database.
+
+    The body owns its session rather than borrowing the request's
+    `get_session` dependency, so the server-side cursor stays open for
+    exactly as long as the response is being written. `read_only` picks
+    a replica or the primary, as `get_read_session` does.
+    """
+    adapter = type_adapter(model)
+
+    async def body():
+        async with sessionmanager.session(read_only=read_only) as db:
+            async for row in rows(db):
+                yield adapter.dump_json(
+                    adapter.validate_python(row, from_attributes=True)
+                ) + b'\n'
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
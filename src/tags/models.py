@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 import sqlalchemy.dialects.postgresql as pg
 from datetime import datetime
@@ -18,14 +18,18 @@ class Tag(Base):
     )
     title = Column(String, unique=True)
     datetime_created = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
     datetime_updated = Column(
-        pg.TIMESTAMP, default=datetime.now()
+        pg.TIMESTAMP, default=datetime.now
     )
 
     blogs = relationship(
-        Blog, secondary='blog_tags', back_populates='tags', lazy='selectin'
+        Blog, secondary='blog_tags', back_populates='tags'
+    )
+
+    __table_args__ = (
+        Index('ix_tags_datetime_created_uid', 'datetime_created', 'uid'),
     )
 
     def __repr__(self):
@@ -41,3 +45,7 @@ class BlogTag(Base):
     tag_uid = Column(
         pg.UUID, ForeignKey('tags.uid'), primary_key=True, default=None
     )
+
+    __table_args__ = (
+        Index('ix_blog_tags_tag_uid_blog_uid', 'tag_uid', 'blog_uid'),
+    )
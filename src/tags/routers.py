@@ -1,29 +1,34 @@
-from fastapi import APIRouter, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated, List
+from typing import Annotated
 
-from src.db.main import get_session
+from src.db.main import get_read_session, get_session
 from src.errors import TagNotFound
-from src.tags.schemas import TagAddRequest, TagCreateRequest, TagShowModel
+from src.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from src.serialization import model_response
+from src.tags.schemas import BlogTagsModel, TagAddRequest, TagCreateRequest, TagShowModel
 from src.tags.service import TagService
 
 
 tags_router = APIRouter()
 tag_service = TagService()
 db_dependency = Annotated[AsyncSession, Depends(get_session)]
+read_db_dependency = Annotated[AsyncSession, Depends(get_read_session)]
 
 
 @tags_router.get(
     '/',
     status_code=status.HTTP_200_OK,
-    response_model=List[TagShowModel]
+    response_model=Page[TagShowModel]
 )
 async def get_all_tags(
-    db: db_dependency
+    db: read_db_dependency,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None
 ):
-    tags = await tag_service.get_tags(db)
-    return tags
+    tags = await tag_service.get_tags(db, limit, cursor)
+    return model_response(Page[TagShowModel], tags)
 
 
 @tags_router.get(
@@ -33,14 +38,14 @@ async def get_all_tags(
 )
 async def get_tag(
     tag_uid: str,
-    db: db_dependency
+    db: read_db_dependency
 ):
-    tag = await tag_service.get_tag_by_uid(tag_uid, db)
+    content = await tag_service.get_tag_json(tag_uid, db)
 
-    if not tag:
+    if not content:
         raise TagNotFound()
-    
-    return tag
+
+    return Response(content=content, media_type='application/json')
 
 
 @tags_router.post(
@@ -53,12 +58,13 @@ async def create_tag(
     db: db_dependency
 ):
     new_tag = await tag_service.create_tag(tag_request, db)
-    return new_tag
+    return model_response(TagShowModel, new_tag, status.HTTP_201_CREATED)
 
 
 @tags_router.post(
     '/blogs/{blog_slug}/tags',
     status_code=status.HTTP_201_CREATED,
+    response_model=BlogTagsModel
 )
 async def add_tag_to_blog(
     blog_slug: str,
@@ -69,7 +75,9 @@ async def add_tag_to_blog(
         blog_slug, tag_request, db
     )
 
-    return blog_with_tag
+    return model_response(
+        BlogTagsModel, blog_with_tag, status.HTTP_201_CREATED
+    )
 
 
 @tags_router.put(
@@ -83,7 +91,7 @@ async def update_tag(
     db: db_dependency
 ):
     tag = await tag_service.update_tag(tag_uid, tag_update_request, db)
-    return tag
+    return model_response(TagShowModel, tag, status.HTTP_202_ACCEPTED)
 
 
 @tags_router.delete(
@@ -16,3 +16,8 @@ class TagCreateRequest(BaseModel):
 
 class TagAddRequest(BaseModel):
     tags: List[TagCreateRequest]
+
+
+class BlogTagsModel(BaseModel):
+    slug: str
+    tags: List[TagShowModel]
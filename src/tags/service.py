@@ -1,29 +1,96 @@
+import uuid
+from functools import cache
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, literal, select
+from sqlalchemy.dialects.postgresql import insert
 
+from src.blog.models import Blog
 from src.blog.service import BlogService
+from src.cache import STALE, TieredCache, cache_backend
+from src.config import Config
 from src.errors import BlogNotFound, TagAlreadyExists, TagNotFound
-from src.tags.models import Tag
-from src.tags.schemas import TagAddRequest, TagCreateRequest
+from src.pagination import DEFAULT_PAGE_SIZE, build_page, keyset_paginate
+from src.serialization import dump_json
+from src.tags.models import BlogTag, Tag
+from src.tags.schemas import TagAddRequest, TagCreateRequest, TagShowModel
 
 
 blog_service = BlogService()
 
+tag_cache = TieredCache(
+    'tag',
+    maxsize=Config.TAG_CACHE_SIZE,
+    ttl=Config.TAG_CACHE_TTL,
+    backend=cache_backend
+)
+
+
+# Built once, see user_by_username() in src.auth.service.
+@cache
+def tag_by_uid() -> Select:
+    return select(Tag).where(Tag.uid == bindparam('uid'))
+
+
+def canonical_uid(tag_uid: str) -> str | None:
+    """The lower-case hyphenated form, so each tag has one cache key."""
+    try:
+        return str(uuid.UUID(tag_uid))
+    except ValueError:
+        return None
+
 
 class TagService:
     async def get_tags(
-        self, db: AsyncSession
+        self,
+        db: AsyncSession,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None
     ):
-        tags = await db.execute(select(Tag))
-        return tags.scalars().all()
+        statement = keyset_paginate(select(Tag), Tag, limit, cursor)
+        tags = await db.execute(statement)
+        return build_page(tags.scalars().all(), limit)
 
     async def get_tag_by_uid(
         self, tag_uid: str, db: AsyncSession
     ):
-        tag = await db.execute(select(Tag).where(Tag.uid == tag_uid))
+        tag_uid = canonical_uid(tag_uid)
+
+        if tag_uid is None:
+            return None
+
+        tag = await db.execute(tag_by_uid(), {'uid': tag_uid})
         return tag.scalars().first()
 
+    async def get_tag_json(
+        self, tag_uid: str, db: AsyncSession
+    ):
+        tag_uid = canonical_uid(tag_uid)
+
+        if tag_uid is None:
+            return None
+
+        cached = await tag_cache.get(tag_uid)
+
+        if cached is not None and cached is not STALE:
+            return cached
+
+        tag = await self.get_tag_by_uid(tag_uid, db)
+
+        if not tag:
+            return None
+
+        content = dump_json(TagShowModel, tag)
+
+        if cached is None:
+            await tag_cache.set(tag_uid, content)
+
+        return content
+
+    async def invalidate_tag(self, tag_uid: str) -> None:
+        # Held for the read-your-writes window, as for blog details.
+        await tag_cache.invalidate(tag_uid, hold=Config.READ_YOUR_WRITES_SECONDS)
+
     async def create_tag(
         self, tag_request: TagCreateRequest, db: AsyncSession
     ):
@@ -44,26 +111,41 @@ class TagService:
     async def add_tag_to_blog(
         self, blog_slug: str, tag_request: TagAddRequest, db: AsyncSession
     ):
-        blog = await blog_service.get_blog_by_slug(blog_slug, db)
+        result = await db.execute(
+            select(Blog.uid).where(Blog.slug == blog_slug)
+        )
+        blog_uid = result.scalars().first()
 
-        if not blog:
+        if not blog_uid:
             raise BlogNotFound()
 
-        for tag_item in tag_request.tags:
-            result = await db.execute(
-                select(Tag).where(Tag.title == tag_item.title)
-            )
-            tag = result.scalars().first()
-
-            if not tag:
-                tag = Tag(title=tag_item.title)
+        titles = list(dict.fromkeys(tag_item.title for tag_item in tag_request.tags))
 
-            blog.tags.append(tag)
+        if titles:
+            await db.execute(
+                insert(Tag)
+                .values([{'title': title} for title in titles])
+                .on_conflict_do_nothing(index_elements=[Tag.title])
+            )
+            await db.execute(
+                insert(BlogTag)
+                .from_select(
+                    ['blog_uid', 'tag_uid'],
+                    select(literal(blog_uid, BlogTag.blog_uid.type), Tag.uid)
+                    .where(Tag.title.in_(titles))
+                )
+                .on_conflict_do_nothing()
+            )
+            await db.commit()
+            await blog_service.invalidate_blog_detail(blog_slug)
 
-        db.add(blog)
-        await db.commit()
-        await db.refresh(blog)
-        return blog
+        tags = await db.execute(
+            select(Tag)
+            .join(BlogTag, BlogTag.tag_uid == Tag.uid)
+            .where(BlogTag.blog_uid == blog_uid)
+            .order_by(Tag.title)
+        )
+        return {'slug': blog_slug, 'tags': tags.scalars().all()}
 
     async def update_tag(
         self, tag_uid: str, tag_update_request: TagCreateRequest, db: AsyncSession
@@ -81,6 +163,7 @@ class TagService:
             await db.commit()
             await db.refresh(tag)
 
+        await self.invalidate_tag(str(tag.uid))
         return tag
 
     async def delete_tag(
@@ -91,5 +174,7 @@ class TagService:
         if not tag:
             raise TagNotFound()
 
+        cache_key = str(tag.uid)
         await db.delete(tag)
         await db.commit()
+        await self.invalidate_tag(cache_key)
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import logging
+
+import pytest
+
+from src import cache as cache_module
+from src.cache import STALE, MemoryBackend, RedisBackend, TieredCache
+
+
+def two_workers() -> tuple[TieredCache, TieredCache]:
+    """Two caches sharing one backend, as two workers share one Redis."""
+    backend = MemoryBackend()
+    return (
+        TieredCache('blog', maxsize=10, ttl=60, backend=backend),
+        TieredCache('blog', maxsize=10, ttl=60, backend=backend),
+    )
+
+
+def test_fill_is_shared_through_the_backend():
+    async def run():
+        first, second = two_workers()
+
+        await first.set('blog-1', b'{"v":1}')
+
+        assert await second.get('blog-1') == b'{"v":1}'
+
+    asyncio.run(run())
+
+
+def test_invalidate_drops_the_other_workers_copy():
+    async def run():
+        first, second = two_workers()
+        await first.set('blog-1', b'{"v":1}')
+        await second.get('blog-1')
+
+        await first.invalidate('blog-1')
+
+        assert await second.get('blog-1') is None
+        assert await first.get('blog-1') is None
+
+    asyncio.run(run())
+
+
+def test_invalidation_ignores_other_namespaces():
+    async def run():
+        backend = MemoryBackend()
+        blogs = TieredCache('blog', maxsize=10, backend=backend)
+        tags = TieredCache('tag', maxsize=10, backend=backend)
+        await tags.set('blog-1', b'tag')
+
+        await blogs.invalidate('blog-1')
+
+        assert await tags.get('blog-1') == b'tag'
+
+    asyncio.run(run())
+
+
+def test_hold_refuses_a_stale_refill():
+    async def run():
+        first, second = two_workers()
+        await first.set('blog-1', b'{"v":1}')
+        await second.get('blog-1')
+
+        await first.invalidate('blog-1', hold=60)
+
+        # A worker that read the old row from a lagging replica.
+        assert await second.get('blog-1') is STALE
+        await second.set('blog-1', b'{"v":1}')
+
+        assert await second.get('blog-1') is STALE
+        assert await first.get('blog-1') is STALE
+
+    asyncio.run(run())
+
+
+def test_fills_resume_after_the_hold():
+    async def run():
+        first, second = two_workers()
+
+        await first.invalidate('blog-1', hold=0.05)
+        await asyncio.sleep(0.1)
+
+        assert await second.get('blog-1') is None
+        await second.set('blog-1', b'{"v":2}')
+
+        assert await first.get('blog-1') == b'{"v":2}'
+
+    asyncio.run(run())
+
+
+def test_without_a_backend_the_cache_is_l1_only():
+    async def run():
+        cache = TieredCache('blog', maxsize=10)
+        await cache.set('blog-1', b'{"v":1}')
+        assert await cache.get('blog-1') == b'{"v":1}'
+
+        await cache.invalidate('blog-1', hold=60)
+        await cache.set('blog-1', b'{"v":1}')
+
+        assert await cache.get('blog-1') is STALE
+
+    asyncio.run(run())
+
+
+class FakePubSub:
+    """Yields `messages`, then fails like a dropped connection or blocks."""
+
+    def __init__(self, messages: list[str], drop: bool) -> None:
+        self.messages = messages
+        self.drop = drop
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        pass
+
+    async def listen(self):
+        yield {'type': 'subscribe', 'data': 1}
+        for message in self.messages:
+            yield {'type': 'message', 'data': message.encode()}
+
+        if self.drop:
+            raise ConnectionError('Connection closed by server.')
+        await asyncio.Event().wait()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self, pubsubs: list[FakePubSub]) -> None:
+        self.pubsubs = pubsubs
+        self.subscribed = 0
+        self.resubscribed = asyncio.Event()
+
+    def pubsub(self) -> FakePubSub:
+        pubsub = self.pubsubs[self.subscribed]
+        self.subscribed += 1
+        if self.subscribed == len(self.pubsubs):
+            self.resubscribed.set()
+        return pubsub
+
+    async def get(self, key: str) -> None:
+        return None
+
+    async def set(self, *args, **kwargs) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def test_listener_resubscribes_and_clears_l1_after_a_drop(monkeypatch, caplog):
+    pytest.importorskip('redis')
+    monkeypatch.setattr(cache_module, 'LISTENER_RETRY_SECONDS', 0)
+
+    async def run():
+        dropped = FakePubSub([json.dumps(['blog', 'blog-1', 0])], drop=True)
+        fresh = FakePubSub([], drop=False)
+        backend = RedisBackend('redis://localhost:6379/0')
+        backend._client = FakeRedis([dropped, fresh])
+        cache = TieredCache('blog', maxsize=10, backend=backend)
+        await cache.set('blog-1', b'{"v":1}')
+        await cache.set('blog-2', b'{"v":1}')
+
+        await backend.start()
+        await asyncio.wait_for(backend._client.resubscribed.wait(), timeout=1)
+        await asyncio.sleep(0)
+
+        # blog-2 may have missed an invalidation while disconnected.
+        assert await cache.get('blog-1') is None
+        assert await cache.get('blog-2') is None
+        assert dropped.closed
+
+        await backend.close()
+        assert fresh.closed
+
+    with caplog.at_level(logging.ERROR, logger='src.cache'):
+        asyncio.run(run())
+
+    assert 'Cache invalidation listener failed' in caplog.text
@@ -0,0 +1,69 @@
+"""Query plan checks from scripts/check_query_plans.py, run under pytest.
+
+Skipped unless TEST_DATABASE_URL points at a PostgreSQL database the
+tests may wipe: its schema is dropped and reseeded at PLAN_CHECK_SCALE
+(10k by default). Costs are compared with scripts/query_plans.json.
+"""
+import asyncio
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from scripts.check_query_plans import (
+    CASES,
+    DEFAULT_TOLERANCE,
+    SEQ_SCAN_MIN_PAGES,
+    SEQ_SCAN_MIN_ROWS,
+    capture_plans,
+    check_plan,
+    large_relations,
+    load_baseline,
+    seed
+)
+from src.auth.hashing import password_hasher
+
+
+DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+SCALE = os.environ.get('PLAN_CHECK_SCALE', '10k')
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason='TEST_DATABASE_URL is not set'
+)
+
+
+@pytest.fixture(scope='module')
+def captured():
+    """Seed once and capture every case's plans in a single event loop."""
+    async def run():
+        engine = create_async_engine(DATABASE_URL)
+        try:
+            await seed(engine, SCALE)
+            large = await large_relations(
+                engine, SEQ_SCAN_MIN_ROWS, SEQ_SCAN_MIN_PAGES
+            )
+            plans = {
+                name: await capture_plans(engine, case)
+                for name, case in CASES.items()
+            }
+            return large, plans
+        finally:
+            await engine.dispose()
+            password_hasher.close()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('name', list(CASES))
+def test_query_plan(name, captured):
+    large, plans = captured
+    baseline = load_baseline(SCALE)
+    problems = []
+
+    for index, entry in enumerate(plans[name]):
+        key, _, found = check_plan(
+            name, index, entry, baseline, DEFAULT_TOLERANCE, large
+        )
+        problems.extend(f'{key}: {problem}' for problem in found)
+
+    assert not problems, '\n'.join(problems)